@@ -4,10 +4,94 @@ Handles importing existing spreadsheet data into the database.
 """
 
 import pandas as pd
+import csv
 import json
-from typing import List, Dict, Tuple
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional
 from database import DatabaseManager
 
+# Number of profile inserts or updates queued before they are flushed with executemany
+PROFILE_BATCH_SIZE = 1000
+
+# Rows read from a CSV at a time during import
+CSV_CHUNK_SIZE = 50_000
+
+# Every import column is text: skip dtype inference and NA detection so
+# cells come back as plain strings, with empty cells as ''
+CSV_READ_OPTIONS = {'dtype': str, 'keep_default_na': False, 'na_filter': False}
+
+# Credentials recognised in a therapist's name, matched as whole words
+_CREDENTIALS_RE = re.compile(r'\b(LMHC|LMFC)\b')
+
+# Base URL of each known directory, keyed by the directory name used in the CSVs
+DIRECTORY_BASE_URLS = {
+    'Psychology Today': 'https://www.psychologytoday.com',
+    'Zencare': 'https://zencare.co',
+    'TherapyDen': 'https://www.therapyden.com',
+    'Headway': 'https://headway.co',
+    'Open Path Collective': 'https://openpathcollective.org',
+    'Therapy Route': 'https://www.therapyroute.com',
+    'Share Care': 'https://www.sharecare.com',
+    'ZocDoc': 'https://www.zocdoc.com',
+    'Care Dash': 'https://www.caredash.com',
+    'Health Grades': 'https://www.healthgrades.com',
+    'eHealth Score': 'https://www.ehealthscores.com',
+    'Health Line': 'https://www.healthline.com',
+    'Bark': 'https://www.bark.com',
+    'Alignable': 'https://www.alignable.com',
+    'IOCDF': 'https://iocdf.org',
+    'PSI Directory': 'https://psidirectory.com',
+    'Trauma Therapist Network': 'https://traumatherapistnetwork.com',
+    'Being Seen': 'https://beingseen.org',
+    'Jax Therapy Network': 'https://jaxtherapynetwork.com'
+}
+
+class ProfileBatch:
+    """
+    Queues the profile inserts and updates produced by an import and writes
+    them with executemany, keyed by (therapist_id, directory_id).
+    """
+    
+    def __init__(self, db_manager: DatabaseManager, update_fields: List[str]):
+        self.db = db_manager
+        self.update_fields = update_fields
+        # Profiles already in the database, fetched once instead of per row
+        self.existing_keys = self.db.get_therapist_profile_keys()
+        self.inserts = {}
+        self.updates = {}
+    
+    def add(self, therapist_id: int, directory_id: int, profile_url: str,
+            username: str = "", password: str = "", notes: str = "") -> bool:
+        """Queue a profile, returning True if it will be newly created."""
+        profile_key = (therapist_id, directory_id)
+        
+        if profile_key in self.existing_keys:
+            values = {'profile_url': profile_url, 'username': username,
+                      'password': password, 'notes': notes}
+            self.updates[profile_key] = tuple(values[f] for f in self.update_fields) + profile_key
+            if len(self.updates) >= PROFILE_BATCH_SIZE:
+                self.flush()
+            return False
+        
+        # A later row for a queued profile replaces its values
+        is_new = profile_key not in self.inserts
+        self.inserts[profile_key] = profile_key + (profile_url, username, password, notes)
+        if len(self.inserts) >= PROFILE_BATCH_SIZE:
+            self.flush()
+        return is_new
+    
+    def flush(self):
+        """Write all queued inserts, then all queued updates."""
+        self.db.add_therapist_profiles_bulk(list(self.inserts.values()))
+        self.existing_keys.update(self.inserts)
+        self.inserts.clear()
+        
+        self.db.update_therapist_profiles_bulk(self.update_fields, list(self.updates.values()))
+        self.updates.clear()
+
+
 class CSVImporter:
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
@@ -18,238 +102,177 @@ class CSVImporter:
         Returns statistics about the import.
         """
         try:
-            df = pd.read_csv(csv_path)
-            
-            # Clean up the data
-            df = df.dropna(subset=['Therapist', 'Directory'])
-            df = df[df['Therapist'] != '']
-            df = df[df['Directory'] != '']
+            # Run the whole import as one transaction so it commits once
+            self.db.begin(bulk=True)
             
             stats = {
                 'therapists_processed': 0,
                 'profiles_created': 0,
-                'directories_found': set(),
+                'directories_found': {},  # used as an insertion-ordered set
                 'errors': []
             }
             
+            # Name -> id lookups, fetched once and kept current as rows are inserted
+            therapist_idx = {t['name']: t['id'] for t in self.db.get_all_therapists()}
+            directory_idx = {d['name']: d['id'] for d in self.db.get_all_directories()}
+            
+            profiles = ProfileBatch(self.db, ['profile_url', 'username', 'password', 'notes'])
+            
+            # Stream the file so only one chunk of rows is in memory at a time
             current_therapist = None
-            current_therapist_id = None
+            for df in pd.read_csv(csv_path, chunksize=CSV_CHUNK_SIZE, **CSV_READ_OPTIONS):
+                current_therapist = self._import_details_chunk(
+                    df, stats, therapist_idx, directory_idx, profiles, current_therapist
+                )
             
-            for _, row in df.iterrows():
-                therapist_name = str(row['Therapist']).strip()
-                directory_name = str(row['Directory']).strip()
-                
-                # Skip empty rows or header rows
-                if not therapist_name or therapist_name == 'nan':
-                    continue
-                
-                # If this is a new therapist (not a continuation row)
-                if pd.notna(row['Therapist']) and row['Therapist'] != '':
-                    current_therapist = therapist_name
-                    
-                    # Check if therapist exists, if not create them
-                    existing_therapists = self.db.get_all_therapists()
-                    current_therapist_id = None
-                    
-                    for therapist in existing_therapists:
-                        if therapist['name'] == current_therapist:
-                            current_therapist_id = therapist['id']
-                            break
-                    
-                    if current_therapist_id is None:
-                        # Extract credentials from name if present
-                        credentials = ""
-                        if "LMHC" in current_therapist:
-                            credentials = "LMHC"
-                        elif "LMFC" in current_therapist:
-                            credentials = "LMFC"
-                        
-                        current_therapist_id = self.db.add_therapist(
-                            name=current_therapist,
-                            credentials=credentials
-                        )
-                        stats['therapists_processed'] += 1
-                
-                # Process directory information
-                if directory_name and directory_name != 'nan':
-                    stats['directories_found'].add(directory_name)
-                    
-                    # Check if directory exists, if not create it
-                    existing_directories = self.db.get_all_directories()
-                    directory_id = None
-                    
-                    for directory in existing_directories:
-                        if directory['name'] == directory_name:
-                            directory_id = directory['id']
-                            break
-                    
-                    if directory_id is None:
-                        # Create directory with basic info
-                        directory_id = self.db.add_directory(
-                            name=directory_name,
-                            base_url=self._get_base_url(directory_name)
-                        )
-                    
-                    # Create or update therapist profile
-                    if current_therapist_id:
-                        profile_url = str(row['Directory URL']) if pd.notna(row['Directory URL']) else ""
-                        username = str(row['Username']) if pd.notna(row['Username']) else ""
-                        password = str(row['Password']) if pd.notna(row['Password']) else ""
-                        notes = str(row['Notes']) if pd.notna(row['Notes']) else ""
-                        
-                        # Check if profile already exists
-                        existing_profiles = self.db.get_therapist_profiles(
-                            current_therapist_id, directory_id
-                        )
-                        
-                        if not existing_profiles:
-                            # Create new profile
-                            self.db.add_therapist_profile(
-                                therapist_id=current_therapist_id,
-                                directory_id=directory_id,
-                                profile_url=profile_url,
-                                username=username,
-                                password=password,
-                                notes=notes
-                            )
-                            stats['profiles_created'] += 1
-                        else:
-                            # Update existing profile
-                            profile = existing_profiles[0]
-                            self.db.update_therapist_profile(
-                                profile['id'],
-                                profile_url=profile_url,
-                                username=username,
-                                password=password,
-                                notes=notes
-                            )
+            profiles.flush()
+            
+            self.db.commit()
             
             stats['directories_found'] = list(stats['directories_found'])
             return stats
             
         except Exception as e:
+            self.db.rollback()
             return {'error': str(e)}
     
+    def _import_details_chunk(self, df: pd.DataFrame, stats: Dict, therapist_idx: Dict,
+                              directory_idx: Dict, profiles: ProfileBatch,
+                              current_therapist: Optional[str]) -> Optional[str]:
+        """
+        Import one chunk of rows from the Directory Details CSV.
+        Returns the therapist the chunk ends on, for continuation rows in the next chunk.
+        """
+        # Trim names and URLs a column at a time rather than cell by cell
+        for column in ('Therapist', 'Directory', 'Directory URL'):
+            df[column] = df[column].str.strip()
+        
+        # Continuation rows leave Therapist blank, so carry the name down from above
+        therapists = df['Therapist'].replace('', pd.NA).ffill()
+        if current_therapist is not None:
+            therapists = therapists.fillna(current_therapist)
+        directories = df['Directory']
+        
+        # Create the chunk's unseen therapists in one batch before touching profiles
+        new_therapists = therapists.dropna().drop_duplicates()
+        new_therapists = new_therapists[~new_therapists.isin(list(therapist_idx))]
+        credentials = new_therapists.str.extract(_CREDENTIALS_RE, expand=False).fillna('')
+        therapist_idx.update(self.db.add_therapists_bulk(list(zip(new_therapists, credentials))))
+        stats['therapists_processed'] += len(new_therapists)
+        
+        # Only rows naming both a therapist and a directory describe a profile
+        has_profile = therapists.notna() & (directories != '')
+        
+        new_directories = directories[has_profile].drop_duplicates()
+        new_directories = new_directories[~new_directories.isin(list(directory_idx))]
+        directory_idx.update(self.db.add_directories_bulk(
+            [{'name': name, 'base_url': self._get_base_url(name)} for name in new_directories]
+        ))
+        
+        # Pull each column out once instead of building a Series per row
+        therapist_names = therapists[has_profile].to_numpy()
+        directory_names = directories[has_profile].to_numpy()
+        profile_urls = df['Directory URL'][has_profile].to_numpy()
+        usernames = df['Username'][has_profile].to_numpy()
+        passwords = df['Password'][has_profile].to_numpy()
+        notes_col = df['Notes'][has_profile].to_numpy()
+        
+        stats['directories_found'].update(dict.fromkeys(directory_names))
+        
+        for therapist_name, directory_name, profile_url, username, password, notes in zip(
+            therapist_names, directory_names, profile_urls, usernames, passwords, notes_col
+        ):
+            # Create or update the therapist's profile
+            if profiles.add(therapist_idx[therapist_name], directory_idx[directory_name],
+                            profile_url, username, password, notes):
+                stats['profiles_created'] += 1
+        
+        last_named = therapists.last_valid_index()
+        return current_therapist if last_named is None else therapists[last_named]
+    
     def import_directory_grid(self, csv_path: str) -> Dict:
         """
         Import the Directory Grid CSV file.
         This provides a different view of the same data.
         """
         try:
-            df = pd.read_csv(csv_path)
+            # Run the whole import as one transaction so it commits once
+            self.db.begin(bulk=True)
             
             stats = {
                 'therapists_processed': 0,
                 'profiles_created': 0,
-                'directories_found': set(),
+                'directories_found': {},  # used as an insertion-ordered set
                 'errors': []
             }
             
+            # Name -> id lookups, fetched once and kept current as rows are inserted
+            therapist_idx = {t['name']: t['id'] for t in self.db.get_all_therapists()}
+            directory_idx = {d['name']: d['id'] for d in self.db.get_all_directories()}
+            
             # Get directory names from first row (excluding first column)
-            directory_names = [col for col in df.columns if col != 'Directory']
+            columns = pd.read_csv(csv_path, nrows=0).columns
+            directory_names = [col for col in columns if col != 'Directory']
             
-            for directory_name in directory_names:
-                stats['directories_found'].add(directory_name)
-                
-                # Check if directory exists, if not create it
-                existing_directories = self.db.get_all_directories()
-                directory_id = None
-                
-                for directory in existing_directories:
-                    if directory['name'] == directory_name:
-                        directory_id = directory['id']
-                        break
-                
-                if directory_id is None:
-                    directory_id = self.db.add_directory(
-                        name=directory_name,
-                        base_url=self._get_base_url(directory_name)
-                    )
-                
-                # Process each therapist for this directory
-                for _, row in df.iterrows():
-                    therapist_name = str(row[directory_name]) if pd.notna(row[directory_name]) else ""
-                    
-                    if therapist_name and therapist_name != 'nan' and therapist_name.startswith('http'):
-                        # This is a URL, find the therapist name from the directory column
-                        directory_row = str(row['Directory']) if pd.notna(row['Directory']) else ""
-                        
-                        if directory_row and directory_row != 'nan':
-                            # Find or create therapist
-                            existing_therapists = self.db.get_all_therapists()
-                            therapist_id = None
-                            
-                            for therapist in existing_therapists:
-                                if therapist['name'] == directory_row:
-                                    therapist_id = therapist['id']
-                                    break
-                            
-                            if therapist_id is None:
-                                # Extract credentials from name if present
-                                credentials = ""
-                                if "LMHC" in directory_row:
-                                    credentials = "LMHC"
-                                elif "LMFC" in directory_row:
-                                    credentials = "LMFC"
-                                
-                                therapist_id = self.db.add_therapist(
-                                    name=directory_row,
-                                    credentials=credentials
-                                )
-                                stats['therapists_processed'] += 1
-                            
-                            # Create or update profile
-                            if therapist_id:
-                                existing_profiles = self.db.get_therapist_profiles(
-                                    therapist_id, directory_id
-                                )
-                                
-                                if not existing_profiles:
-                                    self.db.add_therapist_profile(
-                                        therapist_id=therapist_id,
-                                        directory_id=directory_id,
-                                        profile_url=therapist_name
-                                    )
-                                    stats['profiles_created'] += 1
-                                else:
-                                    # Update existing profile with URL
-                                    profile = existing_profiles[0]
-                                    self.db.update_therapist_profile(
-                                        profile['id'],
-                                        profile_url=therapist_name
-                                    )
+            # Create missing directories up front in one batch
+            new_directories = [
+                {'name': name, 'base_url': self._get_base_url(name)}
+                for name in directory_names if name not in directory_idx
+            ]
+            directory_idx.update(self.db.add_directories_bulk(new_directories))
+            stats['directories_found'].update(dict.fromkeys(directory_names))
+            
+            # The grid only carries URLs, so existing profiles keep their other fields
+            profiles = ProfileBatch(self.db, ['profile_url'])
+            
+            # Stream the file so only one chunk of rows is in memory at a time
+            for df in pd.read_csv(csv_path, chunksize=CSV_CHUNK_SIZE, **CSV_READ_OPTIONS):
+                self._import_grid_chunk(df, directory_names, stats, therapist_idx,
+                                        directory_idx, profiles)
+            
+            profiles.flush()
+            
+            self.db.commit()
             
             stats['directories_found'] = list(stats['directories_found'])
             return stats
             
         except Exception as e:
+            self.db.rollback()
             return {'error': str(e)}
     
-    def _get_base_url(self, directory_name: str) -> str:
-        """Get the base URL for a directory based on its name."""
-        url_mapping = {
-            'Psychology Today': 'https://www.psychologytoday.com',
-            'Zencare': 'https://zencare.co',
-            'TherapyDen': 'https://www.therapyden.com',
-            'Headway': 'https://headway.co',
-            'Open Path Collective': 'https://openpathcollective.org',
-            'Therapy Route': 'https://www.therapyroute.com',
-            'Share Care': 'https://www.sharecare.com',
-            'ZocDoc': 'https://www.zocdoc.com',
-            'Care Dash': 'https://www.caredash.com',
-            'Health Grades': 'https://www.healthgrades.com',
-            'eHealth Score': 'https://www.ehealthscores.com',
-            'Health Line': 'https://www.healthline.com',
-            'Bark': 'https://www.bark.com',
-            'Alignable': 'https://www.alignable.com',
-            'IOCDF': 'https://iocdf.org',
-            'PSI Directory': 'https://psidirectory.com',
-            'Trauma Therapist Network': 'https://traumatherapistnetwork.com',
-            'Being Seen': 'https://beingseen.org',
-            'Jax Therapy Network': 'https://jaxtherapynetwork.com'
-        }
+    def _import_grid_chunk(self, df: pd.DataFrame, directory_names: List[str], stats: Dict,
+                           therapist_idx: Dict, directory_idx: Dict, profiles: ProfileBatch):
+        """Import one chunk of rows from the Directory Grid CSV."""
+        # Trim names and URLs a column at a time rather than cell by cell
+        for column in ['Directory'] + directory_names:
+            df[column] = df[column].str.strip()
         
-        return url_mapping.get(directory_name, '')
+        # Reshape to one (therapist, directory, url) row per cell and keep only
+        # URL cells; therapist names live in the first column of each row
+        cells = df.melt(id_vars='Directory', value_vars=directory_names,
+                        var_name='directory_name', value_name='url')
+        cells = cells[(cells['Directory'] != '') & cells['url'].str.startswith('http', na=False)]
+        
+        # Create missing therapists in one batch
+        new_therapists = cells['Directory'].drop_duplicates()
+        new_therapists = new_therapists[~new_therapists.isin(list(therapist_idx))]
+        credentials = new_therapists.str.extract(_CREDENTIALS_RE, expand=False).fillna('')
+        therapist_idx.update(self.db.add_therapists_bulk(list(zip(new_therapists, credentials))))
+        stats['therapists_processed'] += len(new_therapists)
+        
+        for therapist_name, directory_name, profile_url in zip(
+            cells['Directory'].to_numpy(), cells['directory_name'].to_numpy(), cells['url'].to_numpy()
+        ):
+            # Create or update profile
+            if profiles.add(therapist_idx[therapist_name], directory_idx[directory_name], profile_url):
+                stats['profiles_created'] += 1
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_base_url(directory_name: str) -> str:
+        """Get the base URL for a directory based on its name."""
+        return DIRECTORY_BASE_URLS.get(directory_name, '')
     
     def export_to_csv(self, output_path: str, format_type: str = 'details') -> bool:
         """
@@ -266,71 +289,63 @@ class CSVImporter:
             print(f"Export error: {e}")
             return False
     
+    def _build_profile_index(self) -> Dict[int, Dict[int, Tuple]]:
+        """
+        Index every profile as {therapist_id: {directory_id: (url, username, password, notes)}}
+        so exports don't query the database once per therapist/directory pair.
+        """
+        profile_index = defaultdict(dict)
+        for therapist_id, directory_id, *fields in self.db.get_all_profiles():
+            profile_index[therapist_id][directory_id] = tuple(fields)
+        return profile_index
+    
     def _export_details_format(self, output_path: str):
         """Export in the Directory Details format."""
         therapists = self.db.get_all_therapists()
         directories = self.db.get_all_directories()
+        profile_index = self._build_profile_index()
         
-        rows = []
-        for therapist in therapists:
-            # Add therapist header row
-            rows.append({
-                'Therapist': therapist['name'],
-                'Directory': '',
-                'Directory URL': '',
-                'Username': '',
-                'Password': '',
-                'Notes': ''
-            })
+        # Rows are written as they are produced rather than collected first
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(['Therapist', 'Directory', 'Directory URL', 'Username', 'Password', 'Notes'])
             
-            # Add profile rows for each directory
-            for directory in directories:
-                profiles = self.db.get_therapist_profiles(therapist['id'], directory['id'])
+            for therapist in therapists:
+                # Add therapist header row
+                writer.writerow([therapist['name'], '', '', '', '', ''])
                 
-                if profiles:
-                    profile = profiles[0]
-                    rows.append({
-                        'Therapist': '',
-                        'Directory': directory['name'],
-                        'Directory URL': profile['profile_url'],
-                        'Username': profile['username'],
-                        'Password': profile['password'],
-                        'Notes': profile['notes']
-                    })
-                else:
-                    rows.append({
-                        'Therapist': '',
-                        'Directory': directory['name'],
-                        'Directory URL': '',
-                        'Username': '',
-                        'Password': '',
-                        'Notes': ''
-                    })
-        
-        df = pd.DataFrame(rows)
-        df.to_csv(output_path, index=False)
+                # Add profile rows for each directory
+                therapist_profiles = profile_index.get(therapist['id'], {})
+                for directory in directories:
+                    profile = therapist_profiles.get(directory['id'], ('', '', '', ''))
+                    writer.writerow(['', directory['name'], *profile])
     
     def _export_grid_format(self, output_path: str):
         """Export in the Directory Grid format."""
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerows(self._iter_grid_rows())
+    
+    def _iter_grid_rows(self):
+        """Yield the Directory Grid header, then one row of profile URLs per directory."""
         therapists = self.db.get_all_therapists()
         directories = self.db.get_all_directories()
+        profile_index = self._build_profile_index()
         
-        # Create grid data
-        grid_data = []
-        for directory in directories:
-            row = {'Directory': directory['name']}
-            
-            for therapist in therapists:
-                profiles = self.db.get_therapist_profiles(therapist['id'], directory['id'])
-                if profiles and profiles[0]['profile_url']:
-                    row[therapist['name']] = profiles[0]['profile_url']
-                else:
-                    row[therapist['name']] = ''
-            
-            grid_data.append(row)
+        # One column per therapist name; a repeated name keeps its first
+        # position and shows the last therapist with that name
+        therapist_columns = {}
+        for therapist in therapists:
+            therapist_columns[therapist['name']] = profile_index.get(therapist['id'], {})
+        
+        yield ['Directory', *therapist_columns]
         
-        df = pd.DataFrame(grid_data)
-        df.to_csv(output_path, index=False)
+        for directory in directories:
+            row = [directory['name']]
+            for therapist_profiles in therapist_columns.values():
+                profile = therapist_profiles.get(directory['id'])
+                row.append(profile[0] if profile and profile[0] else '')
+            yield row
 
 if __name__ == "__main__":
     # Test the importer
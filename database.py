@@ -6,19 +6,131 @@ Handles therapists, directories, and profile information.
 import sqlite3
 import json
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterator
 import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+import numpy as np
+
+# orjson is much faster for the JSON columns; fall back to the stdlib if it's missing
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+    
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Lists and dicts bound as parameters are stored as JSON text in the JSON columns,
+# and columns selected as "name [json]" are decoded by the driver
+sqlite3.register_adapter(list, _dumps)
+sqlite3.register_adapter(dict, _dumps)
+sqlite3.register_converter('json', _loads)
+
+def _json_column(column: str, empty: str) -> str:
+    """Select a JSON column for the json converter, reading NULL or '' as empty."""
+    return f"COALESCE(NULLIF({column}, ''), '{empty}') AS \"{column} [json]\""
+
+# Rows per multi-row INSERT; 3000 rows of 10 columns stays under SQLite's
+# default limit of 32766 bound parameters per statement
+MULTI_ROW_INSERT_ROWS = 3000
+
+# Prepared statements kept per connection (the driver default is 128); the
+# per-field-set UPDATEs and multi-row INSERTs add up to more than that
+STATEMENT_CACHE_SIZE = 256
+
+# One therapist/directory cell of the coverage matrix; _asdict() gives the dict form
+CoverageCell = namedtuple('CoverageCell', 'has_profile status url last_updated')
+_MISSING_CELL = CoverageCell(False, 'missing', '', None)
+
+# Small-int codes for the coverage status arrays; statuses not listed map to OTHER
+PROFILE_STATUS_CODES = {
+    'missing': 0,
+    'active': 1,
+    'exists_unmanaged': 2,
+    'needs_claiming': 3,
+    'pending': 4,
+    'error': 5,
+    'incorrect_match': 6,
+}
+OTHER_STATUS_CODE = -1
 
 class DatabaseManager:
+    # Statements run on every insert. sqlite3 keeps the compiled form of recently used
+    # SQL per connection, so sharing the text keeps these parsed once per thread.
+    _INSERT_THERAPIST_SQL = '''
+        INSERT INTO therapists (name, credentials, email, phone, bio, specialties,
+                             populations, therapy_styles, techniques, interview_responses)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_DIRECTORY_SQL = '''
+        INSERT INTO directories (name, base_url, login_url, profile_url_template,
+                              is_free, is_premium, premium_cost, ranking_factors,
+                              requirements, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_PROFILE_SQL = '''
+        INSERT INTO therapist_profiles (therapist_id, directory_id, profile_url,
+                                      username, password, status, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    '''
+    # A NULL parameter leaves its column unchanged, so one statement covers any subset
+    _PROFILE_UPDATE_FIELDS = ('profile_url', 'username', 'password', 'status', 'notes',
+                              'ranking_position', 'profile_views', 'contact_requests')
+    _UPDATE_PROFILE_SQL = '''
+        UPDATE therapist_profiles
+        SET profile_url = COALESCE(?, profile_url),
+            username = COALESCE(?, username),
+            password = COALESCE(?, password),
+            status = COALESCE(?, status),
+            notes = COALESCE(?, notes),
+            ranking_position = COALESCE(?, ranking_position),
+            profile_views = COALESCE(?, profile_views),
+            contact_requests = COALESCE(?, contact_requests),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    '''
+    # A profile without a URL counts as missing whatever its stored status
+    _EFFECTIVE_STATUS_SQL = (
+        "CASE WHEN TRIM(COALESCE(tp.profile_url, ''), ' ' || char(9, 10, 13)) = '' "
+        "THEN 'missing' ELSE tp.status END"
+    )
+    # Profiles joined with their names, keyed by (filter by therapist, filter by directory)
+    _PROFILE_SELECT_BASE = f'''
+        SELECT tp.*, {_EFFECTIVE_STATUS_SQL} as effective_status,
+               t.name as therapist_name, COALESCE(d.name, 'Unknown Directory') as directory_name
+        FROM therapist_profiles tp
+        JOIN therapists t ON tp.therapist_id = t.id
+        LEFT JOIN directories d ON tp.directory_id = d.id
+    '''
+    _PROFILE_SELECT_SQL = {
+        (False, False): _PROFILE_SELECT_BASE,
+        (True, False): _PROFILE_SELECT_BASE + 'WHERE tp.therapist_id = ?',
+        (False, True): _PROFILE_SELECT_BASE + 'WHERE tp.directory_id = ?',
+        (True, True): _PROFILE_SELECT_BASE + 'WHERE tp.therapist_id = ? AND tp.directory_id = ?',
+    }
+    
     def __init__(self, db_path: str = "directory_manager.db"):
         self.db_path = db_path
+        # Each thread reuses one connection instead of opening one per call
+        self._local = threading.local()
+        # UPDATE statements built by update_therapists_bulk, by field list
+        self._update_therapists_sql = {}
         self.init_database()
     
     def init_database(self):
         """Initialize the database with required tables."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._open_connection(create=True)
         cursor = conn.cursor()
         
+        # Write-ahead logging lets readers and a writer work concurrently and makes
+        # commits cheaper; it is stored in the database file, so it is set once here
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Therapists table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS therapists (
@@ -183,15 +295,31 @@ class DatabaseManager:
             )
         ''')
         
+        # Indexes for lookups by foreign key. Profiles by therapist are already
+        # covered by the UNIQUE(therapist_id, directory_id) index.
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tp_directory ON therapist_profiles(directory_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_status ON automation_tasks(status, scheduled_time)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_analytics_therapist ON analytics(therapist_id, recorded_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_media_therapist ON therapist_media(therapist_id)')
+        
+        # Refresh planner statistics so the indexes get used
+        cursor.execute('ANALYZE')
+        
         conn.commit()
         conn.close()
         
         # Run migrations for existing databases
         self._run_migrations()
+        
+        # The table columns don't change after migrations, so read them once
+        conn = self._connect()
+        self._directory_cols = tuple(col[1] for col in conn.execute("PRAGMA table_info(directories)"))
+        self._therapist_cols = tuple(col[1] for col in conn.execute("PRAGMA table_info(therapists)"))
+        self._release(conn)
     
     def _run_migrations(self):
         """Run database migrations for existing databases."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._open_connection()
         cursor = conn.cursor()
         
         try:
@@ -211,41 +339,128 @@ class DatabaseManager:
                 ('profile_url_selector', 'TEXT')
             ]
             
+            # sqlite3 runs DDL in autocommit mode, so group the ALTERs into one
+            # explicit transaction and write the schema change once
+            added_columns = []
+            cursor.execute("BEGIN EXCLUSIVE")
             for column_name, column_def in scraper_columns:
                 if column_name not in columns:
                     cursor.execute(f'ALTER TABLE directories ADD COLUMN {column_name} {column_def}')
-                    print(f"Added column {column_name} to directories table")
+                    added_columns.append(column_name)
             
             conn.commit()
-            print("Database migrations completed successfully!")
+            added = f" (added directories columns: {', '.join(added_columns)})" if added_columns else ""
+            print(f"Database migrations completed successfully!{added}")
             
         except Exception as e:
+            conn.rollback()
             print(f"Migration error: {e}")
         finally:
             conn.close()
     
+    def _open_connection(self, create: bool = False) -> sqlite3.Connection:
+        """
+        Open a new connection configured for this database. Only init_database
+        creates the file; later connections open it read-write, so a database
+        removed while the app runs is an error rather than a new empty one.
+        """
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode={'rwc' if create else 'rw'}"
+        # PARSE_COLNAMES only converts columns selected with a "[type]" suffix
+        conn = sqlite3.connect(uri, uri=True, detect_types=sqlite3.PARSE_COLNAMES,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        # Under WAL, NORMAL only syncs at checkpoints and is still crash-safe
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's pooled connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._open_connection()
+        elif conn.in_transaction and not getattr(self._local, 'in_transaction', False):
+            # Work left uncommitted by a call that failed part way is discarded,
+            # as it was when every call had its own connection
+            conn.rollback()
+            self._local.read_cache = None
+        return conn
+    
+    def _release(self, conn: sqlite3.Connection):
+        """Commit the work done on a pooled connection, unless a transaction is open."""
+        if not getattr(self._local, 'in_transaction', False):
+            conn.commit()
+    
+    def begin(self, bulk: bool = False):
+        """
+        Start a transaction on this thread. Every call until commit() or rollback()
+        is part of it, so the work is written with a single commit.
+        With bulk=True the connection is tuned for large imports.
+        """
+        conn = self._connect()
+        if bulk:
+            # Grow the page cache for the import; it is restored when the transaction ends
+            self._local.cache_size = conn.execute('PRAGMA cache_size').fetchone()[0]
+            conn.execute('PRAGMA cache_size=-65536')
+        conn.execute('BEGIN IMMEDIATE')
+        self._local.in_transaction = True
+    
+    def commit(self):
+        """Commit and end the transaction started by begin()."""
+        self._end_transaction(commit=True)
+    
+    def rollback(self):
+        """Discard and end the transaction started by begin(), if any."""
+        self._end_transaction(commit=False)
+    
+    def _end_transaction(self, commit: bool):
+        """Commit or roll back this thread's open transaction and undo any bulk tuning."""
+        if not getattr(self._local, 'in_transaction', False):
+            return
+        
+        conn = self._local.conn
+        self._local.in_transaction = False
+        if commit:
+            conn.commit()
+        else:
+            conn.rollback()
+            # Reads cached inside the transaction may include the discarded rows
+            self._local.read_cache = None
+        
+        cache_size = getattr(self._local, 'cache_size', None)
+        if cache_size is not None:
+            self._local.cache_size = None
+            conn.execute(f'PRAGMA cache_size={int(cache_size)}')
+    
+    def close(self):
+        """
+        Checkpoint the write-ahead log and truncate it so it doesn't keep growing,
+        then close this thread's pooled connection. Connections pooled by other
+        threads are closed when those threads exit.
+        """
+        conn = self._connect()
+        self.rollback()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.close()
+        self._local.conn = None
+    
     def add_therapist(self, name: str, credentials: str = "", email: str = "", 
                      phone: str = "", bio: str = "", specialties: List[str] = None,
                      populations: List[str] = None, therapy_styles: List[str] = None,
                      techniques: List[str] = None, interview_responses: Dict = None) -> int:
         """Add a new therapist to the database."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO therapists (name, credentials, email, phone, bio, specialties,
-                                 populations, therapy_styles, techniques, interview_responses)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (name, credentials, email, phone, bio,
-              json.dumps(specialties or []),
-              json.dumps(populations or []),
-              json.dumps(therapy_styles or []),
-              json.dumps(techniques or []),
-              json.dumps(interview_responses or {})))
+        cursor.execute(self._INSERT_THERAPIST_SQL,
+                       (name, credentials, email, phone, bio,
+                        specialties or [],
+                        populations or [],
+                        therapy_styles or [],
+                        techniques or [],
+                        interview_responses or {}))
         
         therapist_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._release(conn)
         return therapist_id
     
     def add_directory(self, name: str, base_url: str = "", login_url: str = "",
@@ -254,23 +469,18 @@ class DatabaseManager:
                      ranking_factors: Dict = None, requirements: Dict = None,
                      notes: str = "") -> int:
         """Add a new directory to the database."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO directories (name, base_url, login_url, profile_url_template,
-                                  is_free, is_premium, premium_cost, ranking_factors,
-                                  requirements, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (name, base_url, login_url, profile_url_template,
-              is_free, is_premium, premium_cost,
-              json.dumps(ranking_factors or {}),
-              json.dumps(requirements or {}),
-              notes))
+        cursor.execute(self._INSERT_DIRECTORY_SQL,
+                       (name, base_url, login_url, profile_url_template,
+                        is_free, is_premium, premium_cost,
+                        ranking_factors or {},
+                        requirements or {},
+                        notes))
         
         directory_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._release(conn)
         return directory_id
     
     def add_therapist_profile(self, therapist_id: int, directory_id: int,
@@ -278,239 +488,388 @@ class DatabaseManager:
                             password: str = "", status: str = "active",
                             notes: str = "") -> int:
         """Add a therapist profile for a specific directory."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO therapist_profiles (therapist_id, directory_id, profile_url,
-                                          username, password, status, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (therapist_id, directory_id, profile_url, username, password, status, notes))
+        cursor.execute(self._INSERT_PROFILE_SQL,
+                       (therapist_id, directory_id, profile_url, username, password, status, notes))
         
         profile_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._release(conn)
         return profile_id
     
-    def get_all_therapists(self) -> List[Dict]:
-        """Get all therapists with their information."""
-        conn = sqlite3.connect(self.db_path)
+    def add_therapists_bulk(self, therapists: List[Tuple[str, str]]) -> Dict[str, int]:
+        """Add many (name, credentials) therapists in one transaction, returning {name: id}."""
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM therapists ORDER BY name')
-        rows = cursor.fetchall()
+        therapist_ids = {}
+        for name, credentials in therapists:
+            cursor.execute(self._INSERT_THERAPIST_SQL,
+                           (name, credentials, '', '', '', '[]', '[]', '[]', '[]', '{}'))
+            therapist_ids[name] = cursor.lastrowid
         
-        therapists = []
-        for row in rows:
-            therapist = {
-                'id': row[0],
-                'name': row[1],
-                'credentials': row[2],
-                'email': row[3],
-                'phone': row[4],
-                'bio': row[5],
-                'specialties': json.loads(row[6]) if row[6] else [],
-                'populations': json.loads(row[7]) if row[7] else [],
-                'therapy_styles': json.loads(row[8]) if row[8] else [],
-                'techniques': json.loads(row[9]) if row[9] else [],
-                'interview_responses': json.loads(row[10]) if row[10] else {},
-                'writing_style': row[11],
-                'created_at': row[12],
-                'updated_at': row[13]
-            }
-            therapists.append(therapist)
+        self._release(conn)
+        return therapist_ids
+    
+    def add_directories_bulk(self, directories: List[Dict]) -> Dict[str, int]:
+        """
+        Add many directories in one transaction, returning {name: id}.
+        Each dict takes the same fields as add_directory; only name is required.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
         
-        conn.close()
-        return therapists
+        rows = [(d['name'], d.get('base_url', ''), d.get('login_url', ''),
+                 d.get('profile_url_template', ''), d.get('is_free', True),
+                 d.get('is_premium', False), d.get('premium_cost', 0.0),
+                 d.get('ranking_factors') or {},
+                 d.get('requirements') or {},
+                 d.get('notes', '')) for d in directories]
+        
+        # Insert a chunk of rows per statement with a multi-row VALUES list,
+        # so SQLite parses and plans once per chunk instead of once per row
+        insert_sql, values_sql = self._INSERT_DIRECTORY_SQL.rsplit('VALUES', 1)
+        values_sql = values_sql.strip()
+        for start in range(0, len(rows), MULTI_ROW_INSERT_ROWS):
+            chunk = rows[start:start + MULTI_ROW_INSERT_ROWS]
+            cursor.execute(f"{insert_sql}VALUES {', '.join([values_sql] * len(chunk))}",
+                           [value for row in chunk for value in row])
+        
+        # Directory names are unique, so the new ids can be read back by name
+        names = {d['name'] for d in directories}
+        cursor.execute('SELECT name, id FROM directories')
+        directory_ids = {name: directory_id for name, directory_id in cursor.fetchall() if name in names}
+        
+        self._release(conn)
+        return directory_ids
     
-    def get_all_directories(self) -> List[Dict]:
-        """Get all directories with their information."""
-        conn = sqlite3.connect(self.db_path)
+    def add_therapist_profiles_bulk(self, profiles: List[Tuple]) -> int:
+        """
+        Add many therapist profiles in a single transaction.
+        Each row is (therapist_id, directory_id, profile_url, username, password, notes).
+        """
+        conn = self._connect()
         cursor = conn.cursor()
         
-        # Get column names first to handle dynamic schema
-        cursor.execute("PRAGMA table_info(directories)")
-        columns_info = cursor.fetchall()
-        column_names = [col[1] for col in columns_info]
+        cursor.executemany('''
+            INSERT INTO therapist_profiles (therapist_id, directory_id, profile_url,
+                                          username, password, status, notes)
+            VALUES (?, ?, ?, ?, ?, 'active', ?)
+        ''', profiles)
         
-        cursor.execute('SELECT * FROM directories ORDER BY name')
-        rows = cursor.fetchall()
+        self._release(conn)
+        return len(profiles)
+    
+    def update_therapist_profiles_bulk(self, fields: List[str], rows: List[Tuple]) -> int:
+        """
+        Update many therapist profiles in a single transaction.
+        Each row holds the values for fields, followed by (therapist_id, directory_id).
+        """
+        allowed_fields = ['profile_url', 'username', 'password', 'status', 'notes',
+                          'ranking_position', 'profile_views', 'contact_requests']
+        update_fields = [f"{field} = ?" for field in fields if field in allowed_fields]
+        
+        if not update_fields or len(update_fields) != len(fields):
+            return 0
         
-        directories = []
-        for row in rows:
-            directory = {}
-            for i, column_name in enumerate(column_names):
-                if i < len(row):
-                    if column_name in ['ranking_factors', 'requirements']:
-                        directory[column_name] = json.loads(row[i]) if row[i] else {}
-                    elif column_name in ['is_free', 'is_premium']:
-                        directory[column_name] = bool(row[i])
-                    else:
-                        directory[column_name] = row[i]
-            
-            # Set default values for scraper configuration if not present
-            directory.setdefault('scraper_type', 'generic')
-            directory.setdefault('search_url', '')
-            directory.setdefault('profile_selector', '')
-            directory.setdefault('name_selector', '')
-            directory.setdefault('credentials_selector', '')
-            directory.setdefault('location_selector', '')
-            directory.setdefault('specialties_selector', '')
-            directory.setdefault('profile_url_selector', '')
+        update_fields.append("updated_at = CURRENT_TIMESTAMP")
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        query = (f"UPDATE therapist_profiles SET {', '.join(update_fields)} "
+                 "WHERE therapist_id = ? AND directory_id = ?")
+        cursor.executemany(query, rows)
+        
+        self._release(conn)
+        return len(rows)
+    
+    def update_therapists_bulk(self, fields: List[str], rows: List[Tuple]) -> int:
+        """
+        Update many therapists in a single transaction.
+        Each row holds the values for fields, followed by the therapist id.
+        """
+        key = tuple(fields)
+        query = self._update_therapists_sql.get(key)
+        if query is None:
+            allowed_fields = set(self._therapist_cols) - {'id', 'created_at', 'updated_at'}
+            if not fields or not allowed_fields.issuperset(fields):
+                return 0
             
-            directories.append(directory)
+            update_fields = [f"{field} = ?" for field in fields]
+            update_fields.append("updated_at = CURRENT_TIMESTAMP")
+            query = self._update_therapists_sql[key] = f"UPDATE therapists SET {', '.join(update_fields)} WHERE id = ?"
         
-        conn.close()
-        return directories
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.executemany(query, rows)
+        
+        self._release(conn)
+        return len(rows)
     
-    def get_therapist_profiles(self, therapist_id: int = None, directory_id: int = None) -> List[Dict]:
-        """Get therapist profiles, optionally filtered by therapist or directory."""
-        conn = sqlite3.connect(self.db_path)
+    def get_therapist_profile_keys(self) -> set:
+        """Get the (therapist_id, directory_id) pair of every existing profile."""
+        conn = self._connect()
         cursor = conn.cursor()
         
-        if therapist_id and directory_id:
-            cursor.execute('''
-                SELECT tp.*, t.name as therapist_name, COALESCE(d.name, 'Unknown Directory') as directory_name
-                FROM therapist_profiles tp
-                JOIN therapists t ON tp.therapist_id = t.id
-                LEFT JOIN directories d ON tp.directory_id = d.id
-                WHERE tp.therapist_id = ? AND tp.directory_id = ?
-            ''', (therapist_id, directory_id))
-        elif therapist_id:
-            cursor.execute('''
-                SELECT tp.*, t.name as therapist_name, COALESCE(d.name, 'Unknown Directory') as directory_name
-                FROM therapist_profiles tp
-                JOIN therapists t ON tp.therapist_id = t.id
-                LEFT JOIN directories d ON tp.directory_id = d.id
-                WHERE tp.therapist_id = ?
-            ''', (therapist_id,))
-        elif directory_id:
-            cursor.execute('''
-                SELECT tp.*, t.name as therapist_name, COALESCE(d.name, 'Unknown Directory') as directory_name
-                FROM therapist_profiles tp
-                JOIN therapists t ON tp.therapist_id = t.id
-                LEFT JOIN directories d ON tp.directory_id = d.id
-                WHERE tp.directory_id = ?
-            ''', (directory_id,))
-        else:
-            cursor.execute('''
-                SELECT tp.*, t.name as therapist_name, COALESCE(d.name, 'Unknown Directory') as directory_name
-                FROM therapist_profiles tp
-                JOIN therapists t ON tp.therapist_id = t.id
-                LEFT JOIN directories d ON tp.directory_id = d.id
-            ''')
+        cursor.execute('SELECT therapist_id, directory_id FROM therapist_profiles')
+        profile_keys = set(cursor.fetchall())
+        
+        self._release(conn)
+        return profile_keys
+    
+    def get_therapist_identities(self) -> List[Tuple]:
+        """Get the (id, name, email) of every therapist, in id order."""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT id, name, email FROM therapists ORDER BY id')
+        identities = cursor.fetchall()
+        
+        self._release(conn)
+        return identities
+    
+    def get_all_profiles(self) -> List[Tuple]:
+        """
+        Get the core fields of every therapist profile in one query.
+        Each row is (therapist_id, directory_id, profile_url, username, password, notes).
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
         
+        cursor.execute('''
+            SELECT therapist_id, directory_id, profile_url, username, password, notes
+            FROM therapist_profiles
+        ''')
         rows = cursor.fetchall()
         
-        # Get column names from the cursor description
-        column_names = [description[0] for description in cursor.description]
+        self._release(conn)
+        return rows
+    
+    def _cached_read(self, key: str, load) -> List[Dict]:
+        """
+        Return the rows from load(), reusing this thread's last result while the
+        database is unchanged. PRAGMA data_version moves when another connection
+        commits and total_changes when this one writes, so together they catch
+        every change, including ones made outside DatabaseManager.
+        """
+        conn = self._connect()
+        version = (conn.execute('PRAGMA data_version').fetchone()[0], conn.total_changes)
+        self._release(conn)
+        
+        cache = getattr(self._local, 'read_cache', None)
+        if cache is None:
+            cache = self._local.read_cache = {}
+        
+        cached_version, rows = cache.get(key, (None, None))
+        if cached_version != version:
+            rows = list(load())
+            cache[key] = (version, rows)
+        
+        # Callers annotate the dicts they get back, so hand out copies
+        return [dict(row) for row in rows]
+    
+    def get_all_therapists(self) -> List[Dict]:
+        """Get all therapists with their information."""
+        return self._cached_read('therapists', self.iter_therapists)
+    
+    def iter_therapists(self) -> Iterator[Dict]:
+        """Yield each therapist with their information, without building a list."""
+        conn = self._connect()
+        cursor = conn.cursor()
         
-        profiles = []
-        for row in rows:
-            # Convert row to dictionary for easier access
-            row_dict = dict(zip(column_names, row))
-            
-            # Use the stored status from the database
-            profile_url = row_dict.get('profile_url')
-            stored_status = row_dict.get('status')
-            
-            # Use the stored status, but mark as missing if no URL
-            if profile_url and profile_url.strip():
-                actual_status = stored_status
-            else:
-                actual_status = 'missing'
-            
-            profile = {
-                'id': row_dict.get('id'),
-                'therapist_id': row_dict.get('therapist_id'),
-                'directory_id': row_dict.get('directory_id'),
-                'profile_url': row_dict.get('profile_url'),
-                'username': row_dict.get('username'),
-                'password': row_dict.get('password'),
-                'status': actual_status,  # Use calculated status
-                'stored_status': stored_status,  # Keep original for reference
-                'last_updated': row_dict.get('last_updated'),
-                'last_checked': row_dict.get('last_checked'),
-                'ranking_position': row_dict.get('ranking_position'),
-                'profile_views': row_dict.get('profile_views'),
-                'contact_requests': row_dict.get('contact_requests'),
-                'notes': row_dict.get('notes'),
-                'created_at': row_dict.get('created_at'),
-                'updated_at': row_dict.get('updated_at'),
-                'therapist_name': row_dict.get('therapist_name') or 'Unknown Therapist',
-                'directory_name': row_dict.get('directory_name') or 'Unknown Directory'
-            }
-            profiles.append(profile)
+        # Row lets us look columns up by name; it is set on the cursor so other
+        # users of the pooled connection keep getting plain tuples
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(f'''
+            SELECT id, name, credentials, email, phone, bio,
+                   {_json_column('specialties', '[]')},
+                   {_json_column('populations', '[]')},
+                   {_json_column('therapy_styles', '[]')},
+                   {_json_column('techniques', '[]')},
+                   {_json_column('interview_responses', '{}')},
+                   writing_style, created_at, updated_at
+            FROM therapists ORDER BY name
+        ''')
         
-        conn.close()
-        return profiles
+        try:
+            for row in cursor:
+                yield dict(row)
+        finally:
+            self._release(conn)
     
-    def update_therapist_profile(self, profile_id: int, **kwargs) -> bool:
-        """Update a therapist profile with new information."""
-        conn = sqlite3.connect(self.db_path)
+    def get_all_directories(self) -> List[Dict]:
+        """Get all directories with their information."""
+        return self._cached_read('directories', self.iter_directories)
+    
+    def iter_directories(self) -> Iterator[Dict]:
+        """
+        Yield each directory with its information, without building a list.
+        is_free and is_premium are returned as stored, as 0/1 integers.
+        """
+        conn = self._connect()
         cursor = conn.cursor()
         
-        # Build dynamic update query
-        update_fields = []
-        values = []
+        # Name the columns cached at init; a NULL scraper_type means the generic scraper
+        select_as = {
+            'scraper_type': "COALESCE(scraper_type, 'generic') AS scraper_type",
+            'ranking_factors': _json_column('ranking_factors', '{}'),
+            'requirements': _json_column('requirements', '{}'),
+        }
+        columns = ', '.join(select_as.get(col, col) for col in self._directory_cols)
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(f'SELECT {columns} FROM directories ORDER BY name')
         
-        for field, value in kwargs.items():
-            if field in ['profile_url', 'username', 'password', 'status', 'notes',
-                        'ranking_position', 'profile_views', 'contact_requests']:
-                update_fields.append(f"{field} = ?")
-                values.append(value)
+        try:
+            for row in cursor:
+                yield dict(row)
+        finally:
+            self._release(conn)
+    
+    def get_therapist_profiles(self, therapist_id: int = None, directory_id: int = None) -> List[Dict]:
+        """Get therapist profiles, optionally filtered by therapist or directory."""
+        return list(self.iter_therapist_profiles(therapist_id, directory_id))
+    
+    def iter_therapist_profiles(self, therapist_id: int = None, directory_id: int = None) -> Iterator[Dict]:
+        """Yield therapist profiles one at a time, optionally filtered by therapist or directory."""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        # Only the WHERE clause varies, so there is one statement per filter combination
+        query = self._PROFILE_SELECT_SQL[bool(therapist_id), bool(directory_id)]
+        params = [value for value in (therapist_id, directory_id) if value]
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(query, params)
         
-        if not update_fields:
+        try:
+            for row in cursor:
+                yield self._build_profile(dict(row))
+        finally:
+            self._release(conn)
+    
+    def get_therapist_profile(self, therapist_id: int, directory_id: int) -> Optional[Dict]:
+        """Get a therapist's profile on one directory, or None if there isn't one."""
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        
+        cursor.execute(self._PROFILE_SELECT_SQL[True, True] + ' LIMIT 1', (therapist_id, directory_id))
+        
+        row = cursor.fetchone()
+        
+        self._release(conn)
+        return self._build_profile(dict(row)) if row else None
+    
+    def _build_profile(self, row_dict: Dict) -> Dict:
+        """Build a profile dict from a therapist_profiles row joined with names."""
+        return {
+            'id': row_dict.get('id'),
+            'therapist_id': row_dict.get('therapist_id'),
+            'directory_id': row_dict.get('directory_id'),
+            'profile_url': row_dict.get('profile_url'),
+            'username': row_dict.get('username'),
+            'password': row_dict.get('password'),
+            'status': row_dict.get('effective_status'),  # Calculated in the query
+            'stored_status': row_dict.get('status'),  # Keep original for reference
+            'last_updated': row_dict.get('last_updated'),
+            'last_checked': row_dict.get('last_checked'),
+            'ranking_position': row_dict.get('ranking_position'),
+            'profile_views': row_dict.get('profile_views'),
+            'contact_requests': row_dict.get('contact_requests'),
+            'notes': row_dict.get('notes'),
+            'created_at': row_dict.get('created_at'),
+            'updated_at': row_dict.get('updated_at'),
+            'therapist_name': row_dict.get('therapist_name') or 'Unknown Therapist',
+            'directory_name': row_dict.get('directory_name') or 'Unknown Directory'
+        }
+    
+    def update_therapist_profile(self, profile_id: int, **kwargs) -> bool:
+        """
+        Update a therapist profile with new information.
+        Fields that aren't given, or are None, keep their current value.
+        """
+        if not any(field in kwargs for field in self._PROFILE_UPDATE_FIELDS):
             return False
         
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-        values.append(profile_id)
+        conn = self._connect()
+        cursor = conn.cursor()
         
-        query = f"UPDATE therapist_profiles SET {', '.join(update_fields)} WHERE id = ?"
-        cursor.execute(query, values)
+        params = [kwargs.get(field) for field in self._PROFILE_UPDATE_FIELDS]
+        params.append(profile_id)
+        cursor.execute(self._UPDATE_PROFILE_SQL, params)
         
         success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        self._release(conn)
         return success
     
     def get_coverage_matrix(self) -> Dict:
         """Get a matrix showing therapist coverage across directories."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        # Get all therapists and directories
-        therapists = self.get_all_therapists()
-        directories = self.get_all_directories()
+        # Every therapist/directory pair with its profile (if any), in one query.
+        # The LEFT JOIN ON 1 = 1 is a cross join that keeps therapists when there are no directories
+        cursor.execute(f'''
+            SELECT t.name, d.name, tp.id, tp.profile_url, {self._EFFECTIVE_STATUS_SQL}, tp.last_updated
+            FROM therapists t
+            LEFT JOIN directories d ON 1 = 1
+            LEFT JOIN therapist_profiles tp
+                ON tp.therapist_id = t.id AND tp.directory_id = d.id
+            ORDER BY t.name, t.id, d.name, d.id
+        ''')
         
         # Create coverage matrix
         matrix = {}
-        for therapist in therapists:
-            matrix[therapist['name']] = {}
-            for directory in directories:
-                # Check if profile exists
-                profiles = self.get_therapist_profiles(therapist['id'], directory['id'])
-                if profiles:
-                    profile = profiles[0]
-                    # Use the calculated status from the profile
-                    # Show as having profile if it's active, exists_unmanaged, or needs_claiming (but not incorrect_match)
-                    has_profile = profile['status'] in ['active', 'exists_unmanaged', 'needs_claiming']
-                    matrix[therapist['name']][directory['name']] = {
-                        'has_profile': has_profile,
-                        'status': profile['status'],
-                        'url': profile['profile_url'],
-                        'last_updated': profile['last_updated']
-                    }
-                else:
-                    matrix[therapist['name']][directory['name']] = {
-                        'has_profile': False,
-                        'status': 'missing',
-                        'url': '',
-                        'last_updated': None
-                    }
+        for therapist_name, directory_name, profile_id, profile_url, status, last_updated in cursor:
+            row = matrix.setdefault(therapist_name, {})
+            if directory_name is None:
+                # No directories yet; the therapist still gets an (empty) row
+                continue
+            if profile_id is not None:
+                # Show as having profile if it's active, exists_unmanaged, or needs_claiming (but not incorrect_match)
+                has_profile = status in ['active', 'exists_unmanaged', 'needs_claiming']
+                row[directory_name] = CoverageCell(has_profile, status, profile_url, last_updated)
+            else:
+                row[directory_name] = _MISSING_CELL
         
-        conn.close()
+        self._release(conn)
         return matrix
+    
+    def get_coverage_matrix_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get coverage as (therapist_names, directory_names, status_matrix) arrays.
+        status_matrix[i, j] is the PROFILE_STATUS_CODES code for therapist i on
+        directory j, so counts are vectorized, e.g. (status_matrix == 1).sum(axis=0).
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT id, name FROM therapists ORDER BY name, id')
+        therapists = cursor.fetchall()
+        cursor.execute('SELECT id, name FROM directories ORDER BY name, id')
+        directories = cursor.fetchall()
+        
+        therapist_index = {therapist_id: i for i, (therapist_id, _) in enumerate(therapists)}
+        directory_index = {directory_id: j for j, (directory_id, _) in enumerate(directories)}
+        status_matrix = np.full((len(therapists), len(directories)),
+                                PROFILE_STATUS_CODES['missing'], dtype=np.int8)
+        
+        cursor.execute(f'''
+            SELECT tp.therapist_id, tp.directory_id, {self._EFFECTIVE_STATUS_SQL}
+            FROM therapist_profiles tp
+        ''')
+        for therapist_id, directory_id, status in cursor:
+            i = therapist_index.get(therapist_id)
+            j = directory_index.get(directory_id)
+            if i is not None and j is not None:
+                status_matrix[i, j] = PROFILE_STATUS_CODES.get(status, OTHER_STATUS_CODE)
+        
+        self._release(conn)
+        therapist_names = np.array([name for _, name in therapists], dtype=object)
+        directory_names = np.array([name for _, name in directories], dtype=object)
+        return therapist_names, directory_names, status_matrix
 
 if __name__ == "__main__":
     # Initialize database and add some sample data
@@ -544,7 +903,6 @@ if __name__ == "__main__":
         }
     ]
     
-    for directory in directories:
-        db.add_directory(**directory)
+    db.add_directories_bulk(directories)
     
     print("Database initialized with sample data!")
@@ -6,349 +6,374 @@ Parses and imports therapist data from Google Form CSV exports
 import pandas as pd
 import json
 import re
-from typing import Dict, List, Optional
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional, Tuple
 from database import DatabaseManager
 
+# orjson encodes the list answers much faster; fall back to the stdlib if it's missing
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+# Form responses read from a CSV export at a time
+FORM_CSV_CHUNK_SIZE = 10_000
+
+# Error messages kept in an import's stats; any beyond this are only counted
+MAX_IMPORT_ERRORS = 100
+
+# Patterns used to split and parse form answers, compiled once
+_SPLIT_SEMI = re.compile(r';')
+_SPLIT_COMMA_SEMI = re.compile(r'[,;]')
+_SPLIT_NL_SEMI = re.compile(r'[\n;]')
+_DIGITS = re.compile(r'(\d+)')
+
+# Runs of whitespace, collapsed to one space when comparing names
+_WHITESPACE = re.compile(r'\s+')
+
+def normalize_name(name: str) -> str:
+    """Normalize a therapist name for matching: lowercased, with whitespace collapsed."""
+    return _WHITESPACE.sub(' ', name).strip().lower()
+
+# Every answer is text: skip dtype inference and NA detection so cells come
+# back as plain strings, with unanswered questions as ''. The export is memory
+# mapped so the C parser (the only one that can stream it in chunks) reads it in place
+FORM_READ_OPTIONS = {'dtype': str, 'keep_default_na': False, 'na_filter': False, 'memory_map': True}
+
+# Questions that may hold the therapist's name on the Profile Questions form
+NAME_FIELDS = ('Your full name:', 'Name', 'Therapist Name')
+
+# specialty_details key for each "tell us more" question of the interview form
+FOCUS_AREA_FIELDS = {f'focus_area_{i}': f'Can you tell us more about focus area #{i}?' for i in range(1, 4)}
+
+# A therapist column filled from a form: the question answering it (or a tuple of
+# questions, parsed from the whole chunk), the GoogleFormImporter method parsing
+# the answers and whether the parsed value is stored as JSON
+FormField = namedtuple('FormField', 'column question parse json')
+
+# A form export: the questions identifying the therapist (the first one answered
+# is used), whether they hold the therapist's name or email, and the columns filled
+FormSpec = namedtuple('FormSpec', 'key_questions match_by fields')
+
+# How each Google Form export is matched to therapists and which columns it fills
+FORMS = {
+    'profile_questions': FormSpec(NAME_FIELDS, 'name', (
+        FormField('personal_introduction', 'What should your client know about you?', '_clean_text', False),
+        FormField('therapeutic_approach', 'What is your approach to therapy?', '_clean_text', False),
+        FormField('client_expectations', 'What can clients expect to take away from sessions with you?', '_clean_text', False),
+        FormField('availability', 'What is your availability?', '_clean_text', False),
+        FormField('insurance_providers', 'Please list any insurers that you are in-network with.', '_parse_insurance_providers', True),
+        FormField('caqh_username', 'CAQH Username:', '_clean_text', False),
+        FormField('caqh_password', 'CAQH Password:', '_clean_text', False),
+        FormField('npi', 'What is your NPI?', '_clean_text', False),
+    )),
+    'therapist_interview': FormSpec(('Your full name:',), 'name', (
+        FormField('career_motivation', 'How did you decide to become a therapist?', '_clean_text', False),
+        FormField('guiding_principles', 'What guiding principles inform your work?', '_clean_text', False),
+        FormField('target_population', 'What clientele do you work with most frequently?', '_clean_text', False),
+        FormField('work_history', 'What was your previous work before going into therapy?', '_clean_text', False),
+        FormField('work_rewards', 'What do you find most rewarding about your work?', '_clean_text', False),
+        FormField('personal_interests', 'What do you enjoy doing in your free time?', '_clean_text', False),
+        FormField('book_recommendations', 'Are there any books you often recommend to clients?', '_parse_book_recommendations', True),
+        FormField('specialty_areas', 'What are your top 3 practice focus areas?', '_parse_specialty_areas', True),
+        FormField('specialty_details', tuple(FOCUS_AREA_FIELDS.values()), '_parse_specialty_details', True),
+        FormField('session_structure', 'What would our first session together be like? What happens in ongoing sessions?', '_clean_text', False),
+        FormField('homework_approach', 'Do you assign "homework" between sessions?', '_clean_text', False),
+        FormField('progress_tracking', 'How do you help ensure I\'m making progress in therapy?', '_clean_text', False),
+        FormField('treatment_duration', 'How long do clients typically see you for?', '_clean_text', False),
+        FormField('preparation_guidance', 'How can I prepare for our first session?', '_clean_text', False),
+        FormField('therapy_philosophy', 'What advice would you share with therapy seekers?', '_clean_text', False),
+    )),
+    'therapist_info': FormSpec(('Username',), 'email', (
+        FormField('years_experience', 'How many years of experience as a therapist do you have?', '_parse_years_experience', False),
+        FormField('ideal_client', 'What is your ideal client or population?', '_clean_text', False),
+        FormField('treatment_modalities', 'Treatment approaches that you are comfortable with:', '_parse_treatment_approaches', True),
+        FormField('expertise_areas', 'Areas of Expertise:', '_parse_expertise_areas', True),
+        FormField('ocd_subtypes', 'What subtypes of OCD do you have experience treating?', '_parse_ocd_subtypes', True),
+        FormField('therapy_style', 'What is your personality/style during therapy?', '_clean_text', False),
+        FormField('client_feedback', 'What kind of feedback or comments do clients give you?', '_clean_text', False),
+        FormField('professional_message', 'What message would you give to clients about working with you?', '_clean_text', False),
+    )),
+}
+
+def form_columns(spec: FormSpec) -> frozenset:
+    """Get the export columns a form's import reads; everything else is skipped while parsing."""
+    columns = set(spec.key_questions)
+    for field in spec.fields:
+        if isinstance(field.question, str):
+            columns.add(field.question)
+        else:
+            columns.update(field.question)
+    return frozenset(columns)
+
+class TherapistNameIndex:
+    """
+    Matches form names against therapist names held in memory. Names match when
+    they are equal after normalize_name, so "Smith" no longer matches "Smithson";
+    if two therapists share a normalized name the one with the lower id wins.
+    """
+    
+    def __init__(self, identities: List[Tuple]):
+        self.ids = {}
+        for therapist_id, name, _ in identities:
+            if name:
+                self.ids.setdefault(normalize_name(name), therapist_id)
+    
+    def find(self, name: str) -> Optional[int]:
+        """Get the id of the therapist matching name, or None."""
+        return self.ids.get(normalize_name(name))
+    
+    def find_all(self, names: pd.Series) -> pd.Series:
+        """Get the id of the therapist matching each name, NaN where none does."""
+        normalized = names.str.replace(_WHITESPACE, ' ', regex=True).str.strip().str.lower()
+        return normalized.map(self.ids)
+
 class GoogleFormImporter:
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
     
     def import_profile_questions(self, csv_path: str) -> Dict:
         """Import Profile Questions form data."""
-        try:
-            df = pd.read_csv(csv_path)
-            stats = {'therapists_updated': 0, 'errors': []}
-            
-            for _, row in df.iterrows():
-                try:
-                    # Extract therapist name from timestamp or other identifier
-                    therapist_name = self._extract_therapist_name(row)
-                    if not therapist_name:
-                        continue
-                    
-                    # Find therapist in database
-                    therapist_id = self._find_therapist_by_name(therapist_name)
-                    if not therapist_id:
-                        stats['errors'].append(f"Therapist not found: {therapist_name}")
-                        continue
-                    
-                    # Extract form data
-                    form_data = {
-                        'personal_introduction': self._clean_text(row.get('What should your client know about you?', '')),
-                        'therapeutic_approach': self._clean_text(row.get('What is your approach to therapy?', '')),
-                        'client_expectations': self._clean_text(row.get('What can clients expect to take away from sessions with you?', '')),
-                        'availability': self._clean_text(row.get('What is your availability?', '')),
-                        'insurance_providers': self._parse_insurance_providers(row.get('Please list any insurers that you are in-network with.', '')),
-                        'caqh_username': self._clean_text(row.get('CAQH Username:', '')),
-                        'caqh_password': self._clean_text(row.get('CAQH Password:', '')),
-                        'npi': self._clean_text(row.get('What is your NPI?', '')),
-                        'place_of_birth': self._clean_text(row.get('What is your place of birth (city, state, country)?', ''))
-                    }
-                    
-                    # Update therapist with form data
-                    self._update_therapist_form_data(therapist_id, form_data)
-                    stats['therapists_updated'] += 1
-                    
-                except Exception as e:
-                    stats['errors'].append(f"Error processing row: {str(e)}")
-            
-            return stats
-            
-        except Exception as e:
-            return {'error': str(e)}
+        return self._import_single('profile_questions', csv_path)
     
     def import_therapist_interview(self, csv_path: str) -> Dict:
         """Import Therapist Interview form data."""
+        return self._import_single('therapist_interview', csv_path)
+    
+    def import_therapist_info(self, csv_path: str) -> Dict:
+        """Import Therapist Info form data."""
+        return self._import_single('therapist_info', csv_path)
+    
+    def import_all(self, profile_questions_csv: Optional[str] = None,
+                   therapist_interview_csv: Optional[str] = None,
+                   therapist_info_csv: Optional[str] = None) -> Dict:
+        """
+        Import any of the three form exports together. The answers from every
+        form are merged per therapist, so each therapist's row is updated once.
+        Returns the stats of each form imported, keyed by form.
+        """
+        csv_paths = {
+            'profile_questions': profile_questions_csv,
+            'therapist_interview': therapist_interview_csv,
+            'therapist_info': therapist_info_csv,
+        }
+        
         try:
-            df = pd.read_csv(csv_path)
-            stats = {'therapists_updated': 0, 'errors': []}
+            self.db.begin()
             
-            for _, row in df.iterrows():
+            results = {}
+            pending = {}
+            finders = {}
+            for form, csv_path in csv_paths.items():
+                if not csv_path:
+                    continue
+                
+                spec = FORMS[form]
+                if spec.match_by not in finders:
+                    finders[spec.match_by] = self._therapist_finder(spec.match_by)
+                
+                # A form that can't be read is reported on its own and adds nothing
+                form_pending = {}
                 try:
-                    therapist_name = self._clean_text(row.get('Your full name:', ''))
-                    if not therapist_name:
-                        continue
-                    
-                    # Find therapist in database
-                    therapist_id = self._find_therapist_by_name(therapist_name)
-                    if not therapist_id:
-                        stats['errors'].append(f"Therapist not found: {therapist_name}")
-                        continue
-                    
-                    # Extract interview data
-                    interview_data = {
-                        'career_motivation': self._clean_text(row.get('How did you decide to become a therapist?', '')),
-                        'guiding_principles': self._clean_text(row.get('What guiding principles inform your work?', '')),
-                        'target_population': self._clean_text(row.get('What clientele do you work with most frequently?', '')),
-                        'work_history': self._clean_text(row.get('What was your previous work before going into therapy?', '')),
-                        'work_rewards': self._clean_text(row.get('What do you find most rewarding about your work?', '')),
-                        'personal_interests': self._clean_text(row.get('What do you enjoy doing in your free time?', '')),
-                        'book_recommendations': self._parse_book_recommendations(row.get('Are there any books you often recommend to clients?', '')),
-                        'specialty_areas': self._parse_specialty_areas(row),
-                        'specialty_details': self._parse_specialty_details(row),
-                        'session_structure': self._clean_text(row.get('What would our first session together be like? What happens in ongoing sessions?', '')),
-                        'homework_approach': self._clean_text(row.get('Do you assign "homework" between sessions?', '')),
-                        'progress_tracking': self._clean_text(row.get('How do you help ensure I\'m making progress in therapy?', '')),
-                        'treatment_duration': self._clean_text(row.get('How long do clients typically see you for?', '')),
-                        'preparation_guidance': self._clean_text(row.get('How can I prepare for our first session?', '')),
-                        'therapy_philosophy': self._clean_text(row.get('What advice would you share with therapy seekers?', ''))
-                    }
-                    
-                    # Update therapist with interview data
-                    self._update_therapist_interview_data(therapist_id, interview_data)
-                    stats['therapists_updated'] += 1
-                    
+                    results[form] = self._import_form(spec, csv_path, finders[spec.match_by], form_pending)
                 except Exception as e:
-                    stats['errors'].append(f"Error processing row: {str(e)}")
+                    results[form] = {'error': str(e)}
+                    continue
+                
+                for therapist_id, values in form_pending.items():
+                    pending.setdefault(therapist_id, {}).update(values)
             
-            return stats
+            self._write_updates(pending)
+            
+            self.db.commit()
+            return results
             
         except Exception as e:
+            self.db.rollback()
             return {'error': str(e)}
     
-    def import_therapist_info(self, csv_path: str) -> Dict:
-        """Import Therapist Info form data."""
+    def _import_single(self, form: str, csv_path: str) -> Dict:
+        """Import one form export, writing its updates after every chunk."""
         try:
-            df = pd.read_csv(csv_path)
-            stats = {'therapists_updated': 0, 'errors': []}
+            # Run the whole import as one transaction on this thread's pooled connection
+            self.db.begin()
             
-            for _, row in df.iterrows():
-                try:
-                    # Extract username/email to match therapist
-                    username = self._clean_text(row.get('Username', ''))
-                    if not username:
-                        continue
-                    
-                    # Find therapist by email/username
-                    therapist_id = self._find_therapist_by_email(username)
-                    if not therapist_id:
-                        stats['errors'].append(f"Therapist not found: {username}")
-                        continue
-                    
-                    # Extract years of experience
-                    years_exp = self._parse_years_experience(row.get('How many years of experience as a therapist do you have?', ''))
-                    
-                    # Extract form data
-                    info_data = {
-                        'years_experience': years_exp,
-                        'ideal_client': self._clean_text(row.get('What is your ideal client or population?', '')),
-                        'treatment_modalities': self._parse_treatment_approaches(row.get('Treatment approaches that you are comfortable with:', '')),
-                        'expertise_areas': self._parse_expertise_areas(row.get('Areas of Expertise:', '')),
-                        'ocd_subtypes': self._parse_ocd_subtypes(row.get('What subtypes of OCD do you have experience treating?', '')),
-                        'therapy_style': self._clean_text(row.get('What is your personality/style during therapy?', '')),
-                        'client_feedback': self._clean_text(row.get('What kind of feedback or comments do clients give you?', '')),
-                        'professional_message': self._clean_text(row.get('What message would you give to clients about working with you?', ''))
-                    }
-                    
-                    # Update therapist with info data
-                    self._update_therapist_info_data(therapist_id, info_data)
-                    stats['therapists_updated'] += 1
-                    
-                except Exception as e:
-                    stats['errors'].append(f"Error processing row: {str(e)}")
+            spec = FORMS[form]
+            stats = self._import_form(spec, csv_path, self._therapist_finder(spec.match_by), {},
+                                      flush_chunks=True)
             
+            self.db.commit()
             return stats
             
         except Exception as e:
+            self.db.rollback()
             return {'error': str(e)}
     
-    def _extract_therapist_name(self, row) -> Optional[str]:
-        """Extract therapist name from various possible fields."""
-        # Try different name fields
-        name_fields = ['Your full name:', 'Name', 'Therapist Name']
-        for field in name_fields:
-            if field in row and pd.notna(row[field]):
-                return self._clean_text(row[field])
-        return None
-    
-    def _find_therapist_by_name(self, name: str) -> Optional[int]:
-        """Find therapist by name in database."""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+    def _import_form(self, spec: FormSpec, csv_path: str, find_therapist: Callable[[pd.Series], pd.Series],
+                     pending: Dict, flush_chunks: bool = False) -> Dict:
+        """
+        Read a form export chunk by chunk, collecting each matched therapist's new
+        values in pending. With flush_chunks they are written after every chunk.
+        """
+        stats = {'therapists_updated': 0, 'errors': [], 'errors_omitted': 0}
+        columns = form_columns(spec)
         
-        cursor.execute('SELECT id FROM therapists WHERE name LIKE ?', (f'%{name}%',))
-        result = cursor.fetchone()
-        conn.close()
+        # Stream the file so only one chunk of rows is in memory at a time. Answers
+        # are read as text so a column can't be parsed differently chunk to chunk.
+        for df in pd.read_csv(csv_path, chunksize=FORM_CSV_CHUNK_SIZE,
+                              usecols=lambda column: column in columns, **FORM_READ_OPTIONS):
+            self._import_chunk(spec, df, stats, find_therapist, pending)
+            if flush_chunks:
+                self._write_updates(pending)
         
-        return result[0] if result else None
+        return stats
     
-    def _find_therapist_by_email(self, email: str) -> Optional[int]:
-        """Find therapist by email in database."""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+    def _import_chunk(self, spec: FormSpec, df: pd.DataFrame, stats: Dict,
+                      find_therapist: Callable[[pd.Series], pd.Series], pending: Dict):
+        """Import one chunk of rows from a form export into pending."""
+        
+        # Find each row's therapist by name or email with one hash lookup over the column
+        keys = self._extract_keys(df, spec.key_questions)
+        therapist_ids = find_therapist(keys)
+        answered = keys != ''
+        matched = answered & therapist_ids.notna()
         
-        cursor.execute('SELECT id FROM therapists WHERE email = ?', (email,))
-        result = cursor.fetchone()
-        conn.close()
+        for key in keys[answered & ~matched]:
+            self._record_error(stats, f"Therapist not found: {key}")
         
-        return result[0] if result else None
+        if not matched.any():
+            return
+        
+        # Parse and serialize only the matched rows, a column at a time
+        matched_df = df[matched]
+        values_df = pd.DataFrame({field.column: self._parse_field(matched_df, field) for field in spec.fields},
+                                 index=matched_df.index)
+        fields = list(values_df.columns)
+        
+        # Queue the updates, walking the parsed columns positionally in the order of
+        # spec.fields; later rows for the same therapist overwrite earlier ones
+        matched_ids = therapist_ids[matched].astype('int64').tolist()
+        for therapist_id, values in zip(matched_ids, values_df.itertuples(index=False, name=None)):
+            pending.setdefault(therapist_id, {}).update(zip(fields, values))
+        stats['therapists_updated'] += len(matched_ids)
     
-    def _clean_text(self, text) -> str:
-        """Clean and normalize text data."""
-        if pd.isna(text) or text == '':
-            return ''
-        return str(text).strip()
+    def _parse_field(self, df: pd.DataFrame, field: FormField) -> pd.Series:
+        """Parse the values a chunk of rows gives field, serialized if it's stored as JSON."""
+        answers = self._column(df, field.question) if isinstance(field.question, str) else df
+        values = getattr(self, field.parse)(answers)
+        return self._to_json(values) if field.json else values
     
-    def _parse_insurance_providers(self, text: str) -> List[str]:
-        """Parse insurance providers from text."""
-        if not text or pd.isna(text):
-            return []
+    def _write_updates(self, pending: Dict):
+        """
+        Write the {therapist_id: {field: value}} updates in pending, with one
+        executemany per distinct set of fields, then clear it.
+        """
+        rows_by_fields = {}
+        for therapist_id, values in pending.items():
+            rows_by_fields.setdefault(tuple(values), []).append((*values.values(), therapist_id))
         
+        for fields, rows in rows_by_fields.items():
+            self.db.update_therapists_bulk(list(fields), rows)
+        pending.clear()
+    
+    def _record_error(self, stats: Dict, message: str):
+        """Add an error to an import's stats, counting it instead once MAX_IMPORT_ERRORS are kept."""
+        if len(stats['errors']) < MAX_IMPORT_ERRORS:
+            stats['errors'].append(message)
+        else:
+            stats['errors_omitted'] += 1
+    
+    def _column(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """Get a column from the form export, or an empty one if the form doesn't have it."""
+        if column in df.columns:
+            return df[column]
+        return pd.Series('', index=df.index, dtype=object)
+    
+    def _extract_keys(self, df: pd.DataFrame, questions: Tuple[str, ...]) -> pd.Series:
+        """Extract the name or email identifying the therapist on each row."""
+        # Try each question in turn, taking the first one that was answered
+        keys = pd.Series('', index=df.index, dtype=object)
+        for question in questions:
+            if question in df.columns:
+                keys = keys.where(keys != '', df[question])
+        return self._clean_text(keys)
+    
+    def _therapist_finder(self, match_by: str) -> Callable[[pd.Series], pd.Series]:
+        """Get a lookup from a column of form name or email answers to the matching therapist ids."""
+        if match_by == 'email':
+            email_index = self._build_email_index()
+            return lambda emails: emails.map(email_index)
+        return self._build_name_index().find_all
+    
+    def _build_name_index(self) -> TherapistNameIndex:
+        """Load therapist names once so rows can be matched without a query each."""
+        return TherapistNameIndex(self.db.get_therapist_identities())
+    
+    def _build_email_index(self) -> Dict[str, int]:
+        """Map each therapist email to its id, keeping the first therapist for a shared email."""
+        email_index = {}
+        for therapist_id, _, email in self.db.get_therapist_identities():
+            if email:
+                email_index.setdefault(email, therapist_id)
+        return email_index
+    
+    def _clean_text(self, column: pd.Series) -> pd.Series:
+        """Clean and normalize a column of text data."""
+        return column.str.strip()
+    
+    def _to_json(self, column: pd.Series) -> pd.Series:
+        """Serialize each parsed value of a column to the JSON text stored in the database."""
+        return column.map(_dumps)
+    
+    def _split_items(self, column: pd.Series, pattern: re.Pattern) -> pd.Series:
+        """Split each value of a column on pattern into a list of non-empty items."""
+        # Answers are always text (see FORM_READ_OPTIONS), so no NA checks; strip each item once
+        return column.str.split(pattern, regex=True).map(
+            lambda items: [item for item in map(str.strip, items) if item])
+    
+    def _parse_insurance_providers(self, column: pd.Series) -> pd.Series:
+        """Parse insurance providers from text."""
         # Split by common delimiters
-        providers = re.split(r'[,;]', str(text))
-        return [p.strip() for p in providers if p.strip()]
+        return self._split_items(column, _SPLIT_COMMA_SEMI)
     
-    def _parse_book_recommendations(self, text: str) -> List[str]:
+    def _parse_book_recommendations(self, column: pd.Series) -> pd.Series:
         """Parse book recommendations from text."""
-        if not text or pd.isna(text):
-            return []
-        
         # Split by newlines or common delimiters
-        books = re.split(r'[\n;]', str(text))
-        return [b.strip() for b in books if b.strip()]
+        return self._split_items(column, _SPLIT_NL_SEMI)
     
-    def _parse_specialty_areas(self, row) -> List[str]:
+    def _parse_specialty_areas(self, column: pd.Series) -> pd.Series:
         """Parse top 3 specialty areas."""
-        specialties = []
-        for i in range(1, 4):
-            field = f'What are your top 3 practice focus areas?'
-            if field in row and pd.notna(row[field]):
-                specialties.append(self._clean_text(row[field]))
-        return specialties
+        # The form asks for all three in one checkbox question, answered as a comma separated list
+        return self._split_items(column, _SPLIT_COMMA_SEMI)
     
-    def _parse_specialty_details(self, row) -> Dict:
+    def _parse_specialty_details(self, df: pd.DataFrame) -> pd.Series:
         """Parse detailed explanations of specialty areas."""
-        details = {}
-        for i in range(1, 4):
-            field = f'Can you tell us more about focus area #{i}?'
-            if field in row and pd.notna(row[field]):
-                details[f'focus_area_{i}'] = self._clean_text(row[field])
-        return details
+        # Walk the three answer columns together, keeping the answered ones under their keys
+        keys = tuple(FOCUS_AREA_FIELDS)
+        columns = [self._clean_text(self._column(df, question)) for question in FOCUS_AREA_FIELDS.values()]
+        details = [{key: value for key, value in zip(keys, answers) if value} for answers in zip(*columns)]
+        return pd.Series(details, index=df.index, dtype=object)
     
-    def _parse_treatment_approaches(self, text: str) -> List[str]:
+    def _parse_treatment_approaches(self, column: pd.Series) -> pd.Series:
         """Parse treatment approaches from text."""
-        if not text or pd.isna(text):
-            return []
-        
         # Split by semicolons
-        approaches = re.split(r';', str(text))
-        return [a.strip() for a in approaches if a.strip()]
+        return self._split_items(column, _SPLIT_SEMI)
     
-    def _parse_expertise_areas(self, text: str) -> List[str]:
+    def _parse_expertise_areas(self, column: pd.Series) -> pd.Series:
         """Parse expertise areas from text."""
-        if not text or pd.isna(text):
-            return []
-        
         # Split by semicolons
-        areas = re.split(r';', str(text))
-        return [a.strip() for a in areas if a.strip()]
+        return self._split_items(column, _SPLIT_SEMI)
     
-    def _parse_ocd_subtypes(self, text: str) -> List[str]:
+    def _parse_ocd_subtypes(self, column: pd.Series) -> pd.Series:
         """Parse OCD subtypes from text."""
-        if not text or pd.isna(text):
-            return []
-        
         # Split by semicolons
-        subtypes = re.split(r';', str(text))
-        return [s.strip() for s in subtypes if s.strip()]
+        return self._split_items(column, _SPLIT_SEMI)
     
-    def _parse_years_experience(self, text: str) -> Optional[int]:
+    def _parse_years_experience(self, column: pd.Series) -> pd.Series:
         """Parse years of experience from text."""
-        if not text or pd.isna(text):
-            return None
-        
-        # Extract number from text
-        numbers = re.findall(r'\d+', str(text))
-        return int(numbers[0]) if numbers else None
-    
-    def _update_therapist_form_data(self, therapist_id: int, form_data: Dict):
-        """Update therapist with profile questions form data."""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE therapists 
-            SET personal_introduction = ?, therapeutic_approach = ?, client_expectations = ?,
-                availability = ?, insurance_providers = ?, caqh_username = ?, caqh_password = ?,
-                npi = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        ''', (
-            form_data.get('personal_introduction', ''),
-            form_data.get('therapeutic_approach', ''),
-            form_data.get('client_expectations', ''),
-            form_data.get('availability', ''),
-            json.dumps(form_data.get('insurance_providers', [])),
-            form_data.get('caqh_username', ''),
-            form_data.get('caqh_password', ''),
-            form_data.get('npi', ''),
-            therapist_id
-        ))
-        
-        conn.commit()
-        conn.close()
-    
-    def _update_therapist_interview_data(self, therapist_id: int, interview_data: Dict):
-        """Update therapist with interview form data."""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE therapists 
-            SET career_motivation = ?, guiding_principles = ?, target_population = ?,
-                work_history = ?, work_rewards = ?, personal_interests = ?,
-                book_recommendations = ?, specialty_areas = ?, specialty_details = ?,
-                session_structure = ?, homework_approach = ?, progress_tracking = ?,
-                treatment_duration = ?, preparation_guidance = ?, therapy_philosophy = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        ''', (
-            interview_data.get('career_motivation', ''),
-            interview_data.get('guiding_principles', ''),
-            interview_data.get('target_population', ''),
-            interview_data.get('work_history', ''),
-            interview_data.get('work_rewards', ''),
-            interview_data.get('personal_interests', ''),
-            json.dumps(interview_data.get('book_recommendations', [])),
-            json.dumps(interview_data.get('specialty_areas', [])),
-            json.dumps(interview_data.get('specialty_details', {})),
-            interview_data.get('session_structure', ''),
-            interview_data.get('homework_approach', ''),
-            interview_data.get('progress_tracking', ''),
-            interview_data.get('treatment_duration', ''),
-            interview_data.get('preparation_guidance', ''),
-            interview_data.get('therapy_philosophy', ''),
-            therapist_id
-        ))
-        
-        conn.commit()
-        conn.close()
-    
-    def _update_therapist_info_data(self, therapist_id: int, info_data: Dict):
-        """Update therapist with info form data."""
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE therapists 
-            SET years_experience = ?, ideal_client = ?, treatment_modalities = ?,
-                expertise_areas = ?, ocd_subtypes = ?, therapy_style = ?,
-                client_feedback = ?, professional_message = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        ''', (
-            info_data.get('years_experience'),
-            info_data.get('ideal_client', ''),
-            json.dumps(info_data.get('treatment_modalities', [])),
-            json.dumps(info_data.get('expertise_areas', [])),
-            json.dumps(info_data.get('ocd_subtypes', [])),
-            info_data.get('therapy_style', ''),
-            info_data.get('client_feedback', ''),
-            info_data.get('professional_message', ''),
-            therapist_id
-        ))
-        
-        conn.commit()
-        conn.close()
-    
-    def get_connection(self):
-        """Get database connection."""
-        return self.db.get_connection()
+        # Extract the first number from each value
+        years = column.str.extract(_DIGITS, expand=False).astype('Int64')
+        return years.astype(object).where(years.notna(), None)
@@ -4,10 +4,9 @@ Human-Like Web Scraper for Directory Management System
 Uses human-like mouse movements, clicks, and scrolling to bypass bot detection.
 """
 
+import re
 import time
 import random
-import pyautogui
-import pygetwindow as gw
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -15,23 +14,172 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-import math
+from selenium.common.exceptions import TimeoutException
+import numpy as np
+from functools import lru_cache
 
+# Search form fields; each is one CSS selector list so a field is found in a single
+# round trip, taking the first displayed match in document order
+SEARCH_INPUT_SELECTOR = ", ".join([
+    "input[name='search']",
+    "input[placeholder*='search']",
+    "input[type='text']",
+    "#search",
+    ".search-input"
+])
+LOCATION_INPUT_SELECTOR = ", ".join([
+    "input[name='location']",
+    "input[placeholder*='location']",
+    "input[placeholder*='city']",
+    "input[placeholder*='zip']"
+])
+SEARCH_BUTTON_SELECTOR = ", ".join([
+    "button[type='submit']",
+    "input[type='submit']",
+    ".search-button",
+    "#search-button"
+])
+# CSS can't match on text, so a plain <button>Search</button> is looked for by XPath
+# only when none of the selectors above match
+SEARCH_BUTTON_TEXT_XPATH = "//button[contains(normalize-space(.), 'Search')]"
 
-class HumanLikeScraper:
-    """Human-like web scraper that mimics real user behavior."""
-    
-    def __init__(self):
+# Selectors tried in order for the result cards; the first one matching anything is used
+PROFILE_SELECTORS = [
+    ".profile-card",
+    ".profile",
+    ".therapist-card",
+    "[class*='profile']",
+    "[class*='therapist']",
+    ".result-item",
+    ".search-result"
+]
+
+# Selectors tried in order for the name link inside a card
+NAME_SELECTORS = [
+    "a[href*='profile']",
+    "h3 a",
+    "h2 a",
+    "h4 a",
+    ".name a",
+    ".profile-name a"
+]
+
+CREDENTIALS_SELECTOR = ".credentials, .title, .profile-credentials"
+LOCATION_SELECTOR = ".location, .profile-location, .address"
+
+# Result cards read per search
+MAX_PROFILES = 5
+
+# Reads the fields of the first result cards in the page in one call. A card
+# without a name link gets a null name; a missing credentials or location is null.
+_EXTRACT_PROFILES_JS = """
+const [profileSelectors, nameSelectors, credentialsSelector, locationSelector, limit] = arguments;
+let cards = [];
+for (const selector of profileSelectors) {
+    cards = document.querySelectorAll(selector);
+    if (cards.length) break;
+}
+const text = (node) => node ? node.innerText.trim() : null;
+// Only the first cards are read; the rest are never copied out of the NodeList
+return Array.from({length: Math.min(cards.length, limit)}, (_, i) => {
+    const card = cards[i];
+    let link = null;
+    for (const selector of nameSelectors) {
+        link = card.querySelector(selector);
+        if (link) break;
+    }
+    return {
+        name: text(link),
+        profile_url: link ? link.href : null,
+        credentials: text(card.querySelector(credentialsSelector)),
+        location: text(card.querySelector(locationSelector))
+    };
+});
+"""
+
+# Appends text to an input's value through the native setter, so frameworks that
+# track the value notice the change, and fires the input event typing would
+_APPEND_INPUT_VALUE_JS = """
+const [input, text] = arguments;
+const setValue = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(input), 'value').set;
+setValue.call(input, input.value + text);
+input.dispatchEvent(new Event('input', {bubbles: true}));
+"""
+
+@lru_cache(maxsize=4096)
+def _word_set(text):
+    """Get the set of words in text; cached as a query is scored against every result card."""
+    return frozenset(text.split())
+
+# Resources never needed to read search results, blocked in the browser; profile_scraper
+# blocks the same list. Stylesheets still load: without them is_displayed() can't tell
+# which form fields are visible, and element text and clickability depend on layout.
+BLOCKED_RESOURCE_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*'
+]
+
+# The page's HTTP status (0 where the browser doesn't report it), then its title and
+# the start of its text; enough to recognise a block page without copying the whole
+# page source out of the browser
+_BLOCK_PROBE_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+return [
+    (nav && nav.responseStatus) || 0,
+    (document.title || '') + '|' + (document.body ? document.body.innerText.slice(0, 1024) : '')
+];
+"""
+
+# Markers of a block page in the probed text, matched in a single pass
+_BLOCK_RE = re.compile(r'403|Forbidden|Access Denied')
+
+# Path of the ChromeDriver binary, resolved by webdriver-manager on first use
+_chromedriver_path = None
+
+def _get_chromedriver_path():
+    """Get the ChromeDriver path, resolving it once per process rather than per driver."""
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        from webdriver_manager.chrome import ChromeDriverManager
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+# pyautogui, imported on the first OS mouse movement; it pulls in Pillow and the
+# platform display bindings, which headless runs and match scoring never need
+_pyautogui = None
+
+def _get_pyautogui():
+    """Import and configure pyautogui on first use."""
+    global _pyautogui
+    if _pyautogui is None:
+        import pyautogui
         # Disable PyAutoGUI failsafe for smoother operation
         pyautogui.FAILSAFE = False
         pyautogui.PAUSE = 0.1
+        _pyautogui = pyautogui
+    return _pyautogui
+
+
+class HumanLikeScraper:
+    """Human-like web scraper that mimics real user behavior."""
+    
+    def __init__(self, headless=False, fast_delays=False):
+        # Headless runs have no window for the OS mouse to move over, so the
+        # pyautogui mouse movements are skipped and only in-page actions are used
+        self.headless = headless
         
         # Human-like timing patterns
         self.min_delay = 0.5
         self.max_delay = 2.0
         self.scroll_delay = 0.3
+        # fast_delays shortens every pause between in-page actions to a tenth; the
+        # site only sees the page loads, which these pauses don't space out
+        self.delay_scale = 0.1 if fast_delays else 1.0
+        
+        # One browser is started on first use and reused by every search until close()
+        self.driver = None
         
     def _get_human_driver(self):
         """Get a Selenium WebDriver configured for human-like behavior."""
@@ -44,22 +192,37 @@ class HumanLikeScraper:
         
         # Human-like window size
         chrome_options.add_argument('--window-size=1366,768')
-        chrome_options.add_argument('--start-maximized')
+        if self.headless:
+            chrome_options.add_argument('--headless=new')
+        else:
+            chrome_options.add_argument('--start-maximized')
         
-        # Disable images for faster loading (optional)
-        # chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        # Only the page text is read, so don't load images
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
         
+        driver = None
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(_get_chromedriver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Execute script to hide automation
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            return driver
         except Exception as e:
             print(f"Error creating Chrome driver: {e}")
+            # Don't leave a browser running that nothing refers to
+            if driver:
+                driver.quit()
             return None
+        
+        # Skip fonts, media and ad/analytics scripts too. This only saves load time,
+        # so a driver without CDP support is still used
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
+        except Exception as e:
+            print(f"Could not block resources, loading them all: {e}")
+        
+        return driver
     
     def _human_delay(self, min_time=None, max_time=None):
         """Add human-like random delays."""
@@ -68,11 +231,14 @@ class HumanLikeScraper:
         if max_time is None:
             max_time = self.max_delay
             
-        delay = random.uniform(min_time, max_time)
+        delay = random.uniform(min_time, max_time) * self.delay_scale
         time.sleep(delay)
     
     def _human_mouse_move(self, driver, element):
         """Move mouse to element in a human-like way."""
+        if self.headless:
+            return
+        
         try:
             # Get element location
             location = element.location_once_scrolled_into_view
@@ -95,58 +261,45 @@ class HumanLikeScraper:
     def _curved_mouse_move(self, driver, target_x, target_y):
         """Move mouse in a curved path like a human would."""
         try:
+            pyautogui = _get_pyautogui()
+            
             # Get current mouse position
             current_x, current_y = pyautogui.position()
             
             # Create a curved path with multiple waypoints
             waypoints = self._generate_curved_path(current_x, current_y, target_x, target_y)
             
-            # Move through waypoints
+            # Move through waypoints. The short sleep between them stands in for
+            # pyautogui.PAUSE, which would add 0.1s after every waypoint
             for x, y in waypoints:
-                pyautogui.moveTo(x, y, duration=random.uniform(0.05, 0.15))
-                time.sleep(random.uniform(0.01, 0.03))
+                pyautogui.moveTo(x, y, duration=random.uniform(0.05, 0.15) * self.delay_scale, _pause=False)
+                self._human_delay(0.01, 0.03)
                 
         except Exception as e:
             print(f"Error in curved mouse move: {e}")
     
     def _generate_curved_path(self, start_x, start_y, end_x, end_y, num_points=5):
         """Generate a curved path between two points."""
-        waypoints = []
+        # Linear interpolation between the points, for all waypoints at once
+        t = np.linspace(0.0, 1.0, num_points + 1)
+        x = start_x + (end_x - start_x) * t
+        y = start_y + (end_y - start_y) * t
         
-        for i in range(num_points + 1):
-            t = i / num_points
-            
-            # Linear interpolation
-            x = start_x + (end_x - start_x) * t
-            y = start_y + (end_y - start_y) * t
-            
-            # Add some curve (sine wave)
-            curve_offset = math.sin(t * math.pi) * random.randint(10, 30)
-            x += curve_offset * random.choice([-1, 1])
-            y += curve_offset * random.choice([-1, 1])
-            
-            waypoints.append((int(x), int(y)))
+        # Add some curve (sine wave), bending each waypoint a random way
+        curve_offset = np.sin(t * np.pi) * np.random.randint(10, 31, size=t.shape)
+        x += curve_offset * (1 - (np.random.randint(0, 2, size=t.shape) << 1))
+        y += curve_offset * (1 - (np.random.randint(0, 2, size=t.shape) << 1))
         
-        return waypoints
+        return list(zip(x.astype(int).tolist(), y.astype(int).tolist()))
     
     def _human_click(self, driver, element):
         """Perform a human-like click on an element."""
         try:
-            # Move mouse to element first
-            self._human_mouse_move(driver, element)
-            self._human_delay(0.1, 0.3)
-            
-            # Click with slight randomness
-            actions = ActionChains(driver)
-            actions.move_to_element(element)
-            
-            # Add small random offset
-            offset_x = random.randint(-2, 2)
-            offset_y = random.randint(-2, 2)
-            actions.move_by_offset(offset_x, offset_y)
-            
-            # Human-like click timing
-            actions.pause(random.uniform(0.05, 0.15))
+            # Glide to a point just off the element's centre, pause and click, all in
+            # one chain that the browser animates and performs in a single call
+            actions = ActionChains(driver, duration=random.randint(120, 260))
+            actions.move_to_element_with_offset(element, random.randint(-2, 2), random.randint(-2, 2))
+            actions.pause(random.uniform(0.05, 0.15) * self.delay_scale)
             actions.click()
             actions.perform()
             
@@ -169,7 +322,7 @@ class HumanLikeScraper:
                     driver.execute_script(f"window.scrollBy(0, -{scroll_amount});")
                 
                 # Human-like pause between scrolls
-                time.sleep(random.uniform(0.3, 0.8))
+                self._human_delay(0.3, 0.8)
                 
         except Exception as e:
             print(f"Error scrolling: {e}")
@@ -184,12 +337,13 @@ class HumanLikeScraper:
             element.click()
             self._human_delay(0.1, 0.3)
             
-            # Type with human-like timing
-            for char in text:
-                element.send_keys(char)
-                # Random delay between keystrokes
-                time.sleep(random.uniform(0.05, 0.15))
-                
+            # Fill in all but the last character in one call, then type the last one
+            # so the page's key and input listeners still see a real keystroke
+            if len(text) > 1:
+                element.parent.execute_script(_APPEND_INPUT_VALUE_JS, element, text[:-1])
+            if text:
+                element.send_keys(text[-1])
+            
         except Exception as e:
             print(f"Error typing: {e}")
     
@@ -197,11 +351,13 @@ class HumanLikeScraper:
         """Simulate general human browsing behavior."""
         try:
             # Random mouse movements
-            for _ in range(random.randint(2, 5)):
-                x = random.randint(100, 1200)
-                y = random.randint(100, 600)
-                pyautogui.moveTo(x, y, duration=random.uniform(0.5, 1.5))
-                time.sleep(random.uniform(0.2, 0.8))
+            if not self.headless:
+                pyautogui = _get_pyautogui()
+                for _ in range(random.randint(2, 5)):
+                    x = random.randint(100, 1200)
+                    y = random.randint(100, 600)
+                    pyautogui.moveTo(x, y, duration=random.uniform(0.5, 1.5) * self.delay_scale)
+                    self._human_delay(0.2, 0.8)
             
             # Random scroll
             if random.random() < 0.3:  # 30% chance
@@ -213,177 +369,155 @@ class HumanLikeScraper:
         except Exception as e:
             print(f"Error in human behavior simulation: {e}")
     
+    def _find_displayed(self, driver, selector, by=By.CSS_SELECTOR):
+        """Find the first displayed element matching a CSS selector list (or other locator), or None."""
+        return next((element for element in driver.find_elements(by, selector)
+                     if element.is_displayed()), None)
+    
+    def _get_driver(self):
+        """Get this scraper's browser, starting it on first use."""
+        if self.driver is None:
+            self.driver = self._get_human_driver()
+        return self.driver
+    
+    def close(self):
+        """Quit the browser shared by this scraper's searches, if one was started."""
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"Error closing Chrome driver: {e}")
+            self.driver = None
+    
     def search_psychology_today_human_like(self, search_query):
-        """Search Psychology Today using human-like interactions."""
-        driver = None
+        """
+        Search Psychology Today using human-like interactions. The browser is kept
+        open for the scraper's next search; call close() when done.
+        """
         try:
             print(f"🤖 Starting human-like search for: {search_query.get('name', '')}")
             
-            driver = self._get_human_driver()
+            driver = self._get_driver()
             if not driver:
                 return self._handle_error(search_query, "Psychology Today", "Could not create driver")
             
-            # Navigate to Psychology Today
-            base_url = "https://www.psychologytoday.com/us/therapists"
-            print(f"🌐 Navigating to Psychology Today...")
-            driver.get(base_url)
+            return self._search_psychology_today(driver, search_query)
             
-            # Simulate human behavior on landing page
+        except Exception as e:
+            print(f"❌ Error in human-like search: {e}")
+            # The browser may be unusable after an unexpected error; start a new one next time
+            self.close()
+            return self._handle_error(search_query, "Psychology Today", str(e))
+    
+    def search_psychology_today_human_like_batch(self, search_queries):
+        """
+        Search Psychology Today for several queries one after another in a single
+        browser, returning the results of each query in order. The browser is
+        quit once the batch is done.
+        """
+        try:
+            return [self.search_psychology_today_human_like(search_query) for search_query in search_queries]
+        finally:
+            self.close()
+    
+    def _search_psychology_today(self, driver, search_query):
+        """Run one Psychology Today search on an open driver."""
+        # Navigate to Psychology Today
+        base_url = "https://www.psychologytoday.com/us/therapists"
+        print(f"🌐 Navigating to Psychology Today...")
+        driver.get(base_url)
+        
+        # Check if we got blocked before spending any time on the page: by the response
+        # status, or from the start of the page's text rather than its whole source
+        status, block_probe = driver.execute_script(_BLOCK_PROBE_JS)
+        if status >= 400 or _BLOCK_RE.search(block_probe):
+            print("❌ Blocked by Psychology Today (403 Forbidden)")
+            return self._handle_blocked_search(search_query, "Psychology Today")
+        
+        # Simulate human behavior on landing page
+        self._simulate_human_behavior(driver)
+        
+        # Look for search form
+        try:
+            # Wait for page to load
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            
+            # Find search input field
+            search_input = self._find_displayed(driver, SEARCH_INPUT_SELECTOR)
+            
+            if not search_input:
+                print("❌ Could not find search input field")
+                return self._handle_error(search_query, "Psychology Today", "Search input not found")
+            
+            # Human-like interaction with search
+            print("🔍 Interacting with search field...")
+            
+            # Move to search field
+            self._human_mouse_move(driver, search_input)
+            self._human_delay(0.5, 1.0)
+            
+            # Click on search field
+            self._human_click(driver, search_input)
+            
+            # Type search query
+            self._human_type(search_input, search_query.get('name', ''))
+            
+            # Look for location field
+            location_input = self._find_displayed(driver, LOCATION_INPUT_SELECTOR)
+            
+            if location_input:
+                print("📍 Setting location...")
+                self._human_click(driver, location_input)
+                self._human_type(location_input, search_query.get('location', 'Jacksonville, FL'))
+            
+            # Look for search button
+            search_button = self._find_displayed(driver, SEARCH_BUTTON_SELECTOR)
+            if not search_button:
+                search_button = self._find_displayed(driver, SEARCH_BUTTON_TEXT_XPATH, By.XPATH)
+            
+            if search_button:
+                print("🔍 Clicking search button...")
+                self._human_click(driver, search_button)
+            else:
+                # Try pressing Enter
+                from selenium.webdriver.common.keys import Keys
+                search_input.send_keys(Keys.RETURN)
+            
+            # Wait for results
+            print("⏳ Waiting for search results...")
+            # This wait gives the results page time to load, so it isn't shortened by fast_delays
+            time.sleep(random.uniform(2.0, 4.0))
+            
+            # Simulate human behavior while waiting
             self._simulate_human_behavior(driver)
             
-            # Check if we got blocked
-            if "403" in driver.page_source or "Forbidden" in driver.page_source:
-                print("❌ Blocked by Psychology Today (403 Forbidden)")
-                return self._handle_blocked_search(search_query, "Psychology Today")
+            # Look for results
+            return self._extract_search_results(driver, search_query)
             
-            # Look for search form
-            try:
-                # Wait for page to load
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                
-                # Find search input field
-                search_input = None
-                search_selectors = [
-                    "input[name='search']",
-                    "input[placeholder*='search']",
-                    "input[type='text']",
-                    "#search",
-                    ".search-input"
-                ]
-                
-                for selector in search_selectors:
-                    try:
-                        search_input = driver.find_element(By.CSS_SELECTOR, selector)
-                        if search_input.is_displayed():
-                            break
-                    except NoSuchElementException:
-                        continue
-                
-                if not search_input:
-                    print("❌ Could not find search input field")
-                    return self._handle_error(search_query, "Psychology Today", "Search input not found")
-                
-                # Human-like interaction with search
-                print("🔍 Interacting with search field...")
-                
-                # Move to search field
-                self._human_mouse_move(driver, search_input)
-                self._human_delay(0.5, 1.0)
-                
-                # Click on search field
-                self._human_click(driver, search_input)
-                
-                # Type search query
-                self._human_type(search_input, search_query.get('name', ''))
-                
-                # Look for location field
-                location_input = None
-                location_selectors = [
-                    "input[name='location']",
-                    "input[placeholder*='location']",
-                    "input[placeholder*='city']",
-                    "input[placeholder*='zip']"
-                ]
-                
-                for selector in location_selectors:
-                    try:
-                        location_input = driver.find_element(By.CSS_SELECTOR, selector)
-                        if location_input.is_displayed():
-                            break
-                    except NoSuchElementException:
-                        continue
-                
-                if location_input:
-                    print("📍 Setting location...")
-                    self._human_click(driver, location_input)
-                    self._human_type(location_input, search_query.get('location', 'Jacksonville, FL'))
-                
-                # Look for search button
-                search_button = None
-                button_selectors = [
-                    "button[type='submit']",
-                    "input[type='submit']",
-                    "button:contains('Search')",
-                    ".search-button",
-                    "#search-button"
-                ]
-                
-                for selector in button_selectors:
-                    try:
-                        search_button = driver.find_element(By.CSS_SELECTOR, selector)
-                        if search_button.is_displayed():
-                            break
-                    except NoSuchElementException:
-                        continue
-                
-                if search_button:
-                    print("🔍 Clicking search button...")
-                    self._human_click(driver, search_button)
-                else:
-                    # Try pressing Enter
-                    from selenium.webdriver.common.keys import Keys
-                    search_input.send_keys(Keys.RETURN)
-                
-                # Wait for results
-                print("⏳ Waiting for search results...")
-                self._human_delay(2.0, 4.0)
-                
-                # Simulate human behavior while waiting
-                self._simulate_human_behavior(driver)
-                
-                # Look for results
-                results = self._extract_search_results(driver, search_query)
-                
-                driver.quit()
-                return results
-                
-            except TimeoutException:
-                print("❌ Timeout waiting for search form")
-                return self._handle_timeout(search_query, "Psychology Today")
-            except Exception as e:
-                print(f"❌ Error during search: {e}")
-                return self._handle_error(search_query, "Psychology Today", str(e))
-                
+        except TimeoutException:
+            print("❌ Timeout waiting for search form")
+            return self._handle_timeout(search_query, "Psychology Today")
         except Exception as e:
-            print(f"❌ Error in human-like search: {e}")
-            if driver:
-                driver.quit()
+            print(f"❌ Error during search: {e}")
             return self._handle_error(search_query, "Psychology Today", str(e))
     
     def _extract_search_results(self, driver, search_query):
         """Extract search results from the page."""
         try:
-            profiles = []
+            # Read every profile card's fields in one round trip to the browser
+            cards = driver.execute_script(_EXTRACT_PROFILES_JS, PROFILE_SELECTORS, NAME_SELECTORS,
+                                          CREDENTIALS_SELECTOR, LOCATION_SELECTOR, MAX_PROFILES)
             
-            # Look for profile elements with multiple selectors
-            profile_selectors = [
-                ".profile-card",
-                ".profile",
-                ".therapist-card",
-                "[class*='profile']",
-                "[class*='therapist']",
-                ".result-item",
-                ".search-result"
-            ]
-            
-            profile_elements = []
-            for selector in profile_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        profile_elements.extend(elements)
-                        break
-                except:
-                    continue
+            print(f"📋 Found {len(cards)} potential profile elements")
             
-            print(f"📋 Found {len(profile_elements)} potential profile elements")
-            
-            for element in profile_elements[:5]:  # Limit to first 5
+            query_terms = self._query_terms(search_query)
+            profiles = []
+            for card in cards:
                 try:
                     # Extract profile information
-                    profile_data = self._extract_profile_data(element, search_query)
+                    profile_data = self._extract_profile_data(card, search_query, query_terms)
                     if profile_data:
                         profiles.append(profile_data)
                         
@@ -397,50 +531,20 @@ class HumanLikeScraper:
             print(f"Error extracting results: {e}")
             return []
     
-    def _extract_profile_data(self, element, search_query):
-        """Extract data from a profile element."""
+    def _extract_profile_data(self, card, search_query, query_terms):
+        """Build a result from the fields read off a profile card."""
         try:
-            # Find name link
-            name_elem = None
-            name_selectors = [
-                "a[href*='profile']",
-                "h3 a",
-                "h2 a",
-                "h4 a",
-                ".name a",
-                ".profile-name a"
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    name_elem = element.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if not name_elem:
+            # Cards without a name link aren't profiles
+            if card.get('name') is None:
                 return None
             
-            name = name_elem.text.strip()
-            profile_url = name_elem.get_attribute('href')
-            
-            # Extract other details
-            credentials = ""
-            try:
-                cred_elem = element.find_element(By.CSS_SELECTOR, ".credentials, .title, .profile-credentials")
-                credentials = cred_elem.text.strip()
-            except NoSuchElementException:
-                pass
-            
-            location = search_query.get('location', '')
-            try:
-                loc_elem = element.find_element(By.CSS_SELECTOR, ".location, .profile-location, .address")
-                location = loc_elem.text.strip()
-            except NoSuchElementException:
-                pass
+            name = card['name']
+            profile_url = card['profile_url']
+            credentials = card['credentials'] or ""
+            location = card['location'] if card['location'] is not None else search_query.get('location', '')
             
             # Calculate match score
-            match_score = self._calculate_match_score(search_query, {
+            match_score = self._calculate_match_score(query_terms, {
                 'name': name,
                 'credentials': credentials,
                 'location': location,
@@ -456,7 +560,7 @@ class HumanLikeScraper:
                 'match_score': match_score,
                 'status': 'exists_unmanaged',
                 'npi': search_query.get('npi', ''),
-                'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
+                'license': self._first_license(search_query),
                 'npi_match': False,
                 'license_match': False
             }
@@ -465,23 +569,34 @@ class HumanLikeScraper:
             print(f"Error extracting profile data: {e}")
             return None
     
-    def _calculate_match_score(self, search_query, found_profile):
-        """Calculate match score between search query and found profile."""
+    def _query_terms(self, search_query):
+        """Lowercase and split the parts of a search query used for scoring, once per search."""
+        return {
+            'name': search_query.get('name', '').lower(),
+            'location': search_query.get('location', '').lower(),
+            'specialties': frozenset(s.lower() for s in search_query.get('specialties', [])),
+            'credentials': search_query.get('credentials', '').lower().split()
+        }
+    
+    def _calculate_match_score(self, query_terms, found_profile):
+        """Calculate match score between a search query's terms and a found profile."""
         score = 0
         
         # Name matching (40 points)
-        search_name = search_query.get('name', '').lower()
+        search_name = query_terms['name']
         found_name = found_profile.get('name', '').lower()
         
         if search_name in found_name or found_name in search_name:
             score += 40
-        elif self._name_similarity(search_name, found_name) > 0.7:
-            score += 30
-        elif self._name_similarity(search_name, found_name) > 0.5:
-            score += 20
+        else:
+            name_similarity = self._name_similarity(search_name, found_name)
+            if name_similarity > 0.7:
+                score += 30
+            elif name_similarity > 0.5:
+                score += 20
         
         # Location matching (30 points)
-        search_location = search_query.get('location', '').lower()
+        search_location = query_terms['location']
         found_location = found_profile.get('location', '').lower()
         
         if search_location in found_location or found_location in search_location:
@@ -490,97 +605,77 @@ class HumanLikeScraper:
             score += 20
         
         # Specialties matching (20 points)
-        search_specialties = [s.lower() for s in search_query.get('specialties', [])]
-        found_specialties = [s.lower() for s in found_profile.get('specialties', [])]
-        
-        if search_specialties and found_specialties:
-            common_specialties = set(search_specialties) & set(found_specialties)
-            if common_specialties:
-                score += 20
+        if not query_terms['specialties'].isdisjoint(s.lower() for s in found_profile.get('specialties', [])):
+            score += 20
         
         # Credentials matching (10 points)
-        search_credentials = search_query.get('credentials', '').lower()
         found_credentials = found_profile.get('credentials', '').lower()
         
-        if search_credentials and found_credentials:
-            if any(cred in found_credentials for cred in search_credentials.split()):
-                score += 10
+        if found_credentials and any(cred in found_credentials for cred in query_terms['credentials']):
+            score += 10
         
         return min(score, 100)  # Cap at 100
     
     def _name_similarity(self, name1, name2):
         """Calculate similarity between two names."""
-        words1 = set(name1.split())
-        words2 = set(name2.split())
+        words1 = _word_set(name1)
+        words2 = _word_set(name2)
         
         if not words1 or not words2:
             return 0
         
-        intersection = words1 & words2
-        union = words1 | words2
-        
-        return len(intersection) / len(union) if union else 0
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
     
     def _location_similarity(self, location1, location2):
         """Calculate similarity between two locations."""
-        words1 = set(location1.split())
-        words2 = set(location2.split())
+        words1 = _word_set(location1)
+        words2 = _word_set(location2)
         
         if not words1 or not words2:
             return 0
         
-        intersection = words1 & words2
-        union = words1 | words2
-        
-        return len(intersection) / len(union) if union else 0
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
     
-    def _handle_blocked_search(self, search_query, directory_name):
-        """Handle when search is blocked by anti-bot protection."""
+    def _first_license(self, search_query):
+        """Get the first of the searched therapist's license numbers, or None."""
+        return next(iter((search_query.get('license_numbers') or {}).values()), None)
+    
+    def _failed_search_result(self, search_query, directory_name, name, title, status, error_message):
+        """Build the single placeholder result returned when a search can't be completed."""
         return [{
-            'name': f"Search blocked on {directory_name}",
-            'title': "Manual search required",
+            'name': name,
+            'title': title,
             'location': search_query.get('location', ''),
             'specialties': search_query.get('specialties', []),
             'profile_url': f"https://www.{directory_name.lower().replace(' ', '')}.com",
             'match_score': 0,
-            'status': 'blocked',
+            'status': status,
             'npi': search_query.get('npi', ''),
-            'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
+            'license': self._first_license(search_query),
             'npi_match': False,
             'license_match': False,
-            'error_message': f"Search blocked by {directory_name}. Please search manually using: {search_query.get('name', '')} in {search_query.get('location', '')}"
+            'error_message': error_message
         }]
     
+    def _handle_blocked_search(self, search_query, directory_name):
+        """Handle when search is blocked by anti-bot protection."""
+        return self._failed_search_result(
+            search_query, directory_name, f"Search blocked on {directory_name}", "Manual search required", 'blocked',
+            f"Search blocked by {directory_name}. Please search manually using: {search_query.get('name', '')} in {search_query.get('location', '')}"
+        )
+    
     def _handle_timeout(self, search_query, directory_name):
         """Handle when search times out."""
-        return [{
-            'name': f"Search timed out on {directory_name}",
-            'title': "Please try again",
-            'location': search_query.get('location', ''),
-            'specialties': search_query.get('specialties', []),
-            'profile_url': f"https://www.{directory_name.lower().replace(' ', '')}.com",
-            'match_score': 0,
-            'status': 'timeout',
-            'npi': search_query.get('npi', ''),
-            'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
-            'npi_match': False,
-            'license_match': False,
-            'error_message': f"Search timed out on {directory_name}. The site may be slow or overloaded."
-        }]
+        return self._failed_search_result(
+            search_query, directory_name, f"Search timed out on {directory_name}", "Please try again", 'timeout',
+            f"Search timed out on {directory_name}. The site may be slow or overloaded."
+        )
     
     def _handle_error(self, search_query, directory_name, error_message):
         """Handle general search errors."""
-        return [{
-            'name': f"Error searching {directory_name}",
-            'title': "Search failed",
-            'location': search_query.get('location', ''),
-            'specialties': search_query.get('specialties', []),
-            'profile_url': f"https://www.{directory_name.lower().replace(' ', '')}.com",
-            'match_score': 0,
-            'status': 'error',
-            'npi': search_query.get('npi', ''),
-            'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
-            'npi_match': False,
-            'license_match': False,
-            'error_message': f"Error searching {directory_name}: {error_message}"
-        }]
+        return self._failed_search_result(
+            search_query, directory_name, f"Error searching {directory_name}", "Search failed", 'error',
+            f"Error searching {directory_name}: {error_message}"
+        )
@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 import time
 import re
+import atexit
 from urllib.parse import urljoin, urlencode
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -21,6 +22,88 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 import json
+from human_like_scraper import BLOCKED_RESOURCE_URLS
+
+# Parser behind every BeautifulSoup tree; lxml's C parser builds the tree many times
+# faster than the pure-Python html.parser, with the same soup API on top
+HTML_PARSER = 'lxml'
+
+# Link hrefs that may point at a profile on the Psychology Today results page
+PROFILE_HREF_RE = re.compile(r'profile|therapist', re.I)
+
+# A state segment in a Psychology Today URL, which marks a location listing page
+# (e.g. /therapists/fl/casselberry) rather than a profile
+STATE_PATH_RE = re.compile(r'/(?:fl|ct|ca|ny|tx|ga|nc|sc|al|ms|la|tn|ky|in|oh|mi|wi|mn|ia|mo|ar|ok|ks|ne|nd|sd|mt|wy|co|nm|az|ut|nv|id|wa|or|ak|hi)/', re.I)
+
+# Class names of the credentials and location next to a Psychology Today profile link
+CREDENTIALS_CLASS_RE = re.compile(r'credential|title|degree', re.I)
+LOCATION_CLASS_RE = re.compile(r'location|address|city', re.I)
+
+# Class names of the cards and their name headings on a generic directory page
+PROFILE_CARD_CLASS_RE = re.compile(r'profile|therapist|card')
+NAME_CLASS_RE = re.compile(r'name|title')
+
+# Class names of the fields on a profile page scraped by scrape_profile()
+PROFILE_CREDENTIALS_CLASS_RE = re.compile(r'credentials|title')
+PROFILE_LOCATION_CLASS_RE = re.compile(r'location|address')
+PROFILE_SPECIALTIES_CLASS_RE = re.compile(r'specialties')
+PROFILE_BIO_CLASS_RE = re.compile(r'bio|description|about')
+
+# A US phone number in the text of a profile's phone element
+PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+# Any of the result cards on a Psychology Today search page, waited for as one selector
+RESULT_CARD_SELECTOR = ", ".join([
+    ".profile-card",
+    ".profile",
+    ".therapist-card",
+    "[data-testid*='profile']",
+    ".result-item"
+])
+
+# Selectors tried in order for the name link inside a Psychology Today result card
+NAME_LINK_SELECTORS = [
+    ".profile-name a",
+    ".name a",
+    "h3 a",
+    "h2 a",
+    "h4 a",
+    "a[href*='profile']"
+]
+
+# The first element under a node matching any of the selectors, trying them in
+# order, or null; one round trip to the browser however many selectors miss
+_FIRST_MATCH_JS = """
+const [node, selectors] = arguments;
+for (const selector of selectors) {
+    const match = node.querySelector(selector);
+    if (match) return match;
+}
+return null;
+"""
+
+# Paths of the browser driver binaries, resolved by webdriver-manager on first use
+_chromedriver_path = None
+_geckodriver_path = None
+
+def _get_chromedriver_path():
+    """Get the ChromeDriver path, resolving it once per process rather than per driver."""
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        # Try to use a specific ChromeDriver version compatible with Chrome 114
+        try:
+            _chromedriver_path = ChromeDriverManager(driver_version="114.0.5735.90").install()
+        except:
+            # Fallback to latest version
+            _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+def _get_geckodriver_path():
+    """Get the GeckoDriver path, resolving it once per process rather than per driver."""
+    global _geckodriver_path
+    if _geckodriver_path is None:
+        _geckodriver_path = GeckoDriverManager().install()
+    return _geckodriver_path
 
 
 class ProfileScraper:
@@ -43,6 +126,10 @@ class ProfileScraper:
             'Cache-Control': 'max-age=0'
         })
         
+        # One browser is started by the first Selenium search and reused by the
+        # following ones until close()
+        self.driver = None
+        
     def _get_selenium_driver(self):
         """Get a configured Selenium WebDriver."""
         # Try Chrome first
@@ -76,14 +163,22 @@ class ProfileScraper:
             chrome_options.add_argument('--disable-features=TranslateUI')
             chrome_options.add_argument('--disable-ipc-flooding-protection')
             chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36')
+            # Return from driver.get() once the document is parsed, like Playwright's
+            # domcontentloaded; every caller waits for the elements it needs anyway
+            chrome_options.page_load_strategy = 'eager'
+            # Only page text is read, so don't load images; Chrome has no --disable-images switch
+            chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
             
-            # Try to use a specific ChromeDriver version compatible with Chrome 114
-            try:
-                service = Service(ChromeDriverManager(driver_version="114.0.5735.90").install())
-            except:
-                # Fallback to latest version
-                service = Service(ChromeDriverManager().install())
+            service = Service(_get_chromedriver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
+            
+            # Skip fonts, media and ad/analytics scripts too. This only saves load time,
+            # so a driver without CDP support is still used
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
+            except Exception as e:
+                print(f"⚠️  Could not block resources, loading them all: {e}")
             print("✅ Chrome driver created successfully!")
             return driver
         except Exception as e:
@@ -97,8 +192,10 @@ class ProfileScraper:
             firefox_options.add_argument('--height=1080')
             firefox_options.set_preference("dom.webnotifications.enabled", False)
             firefox_options.set_preference("media.volume_scale", "0.0")
+            firefox_options.set_preference("permissions.default.image", 2)
+            firefox_options.page_load_strategy = 'eager'
             
-            service = FirefoxService(GeckoDriverManager().install())
+            service = FirefoxService(_get_geckodriver_path())
             driver = webdriver.Firefox(service=service, options=firefox_options)
             print("✅ Firefox driver created successfully!")
             return driver
@@ -108,8 +205,43 @@ class ProfileScraper:
         print("❌ All drivers failed")
         return None
     
+    def _get_driver(self):
+        """Get this scraper's search browser, starting it on first use."""
+        if self.driver is not None:
+            # Start each reused search without the previous one's cookies
+            try:
+                self.driver.delete_all_cookies()
+            except Exception as e:
+                print(f"❌ Reused driver failed, starting a new one: {e}")
+                self.close()
+        if self.driver is None:
+            self.driver = self._get_selenium_driver()
+            if self.driver:
+                # Quit the browser on exit if the caller never calls close()
+                atexit.register(self.close)
+        return self.driver
+    
+    def close(self):
+        """Quit the browser shared by this scraper's searches, if one was started."""
+        if self.driver:
+            atexit.unregister(self.close)
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
+            self.driver = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def search_psychology_today_intelligent(self, search_query):
-        """Search Psychology Today using intelligent matching."""
+        """
+        Search Psychology Today using intelligent matching. The browser is kept
+        open for the scraper's next search; call close() when done.
+        """
         try:
             print(f"🔍 Searching Psychology Today for: {search_query.get('name', '')}")
             
@@ -134,7 +266,7 @@ class ProfileScraper:
             params = {k: v for k, v in params.items() if v}
             
             # Try Selenium first for JavaScript-heavy sites
-            driver = self._get_selenium_driver()
+            driver = self._get_driver()
             if driver:
                 try:
                     # Navigate to search page
@@ -145,19 +277,12 @@ class ProfileScraper:
                     # Check if we got blocked
                     if "403" in driver.page_source or "Forbidden" in driver.page_source:
                         print("❌ Blocked by Psychology Today (403 Forbidden)")
-                        driver.quit()
                         return self._handle_blocked_search(search_query, "Psychology Today")
                     
                     # Wait for results to load with multiple possible selectors
                     try:
                         WebDriverWait(driver, 15).until(
-                            EC.any_of(
-                                EC.presence_of_element_located((By.CLASS_NAME, "profile-card")),
-                                EC.presence_of_element_located((By.CLASS_NAME, "profile")),
-                                EC.presence_of_element_located((By.CLASS_NAME, "therapist-card")),
-                                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid*='profile']")),
-                                EC.presence_of_element_located((By.CSS_SELECTOR, ".result-item"))
-                            )
+                            EC.presence_of_element_located((By.CSS_SELECTOR, RESULT_CARD_SELECTOR))
                         )
                         print("✅ Found profile elements")
                     except TimeoutException:
@@ -165,7 +290,6 @@ class ProfileScraper:
                         profile_elements = driver.find_elements(By.CSS_SELECTOR, "[class*='profile'], [class*='therapist'], [class*='result']")
                         if not profile_elements:
                             print("❌ No profile elements found on Psychology Today")
-                            driver.quit()
                             return self._handle_no_results(search_query, "Psychology Today")
                     
                     # Extract profile information
@@ -176,16 +300,11 @@ class ProfileScraper:
                     
                     print(f"📋 Found {len(profile_cards)} profile cards")
                     
+                    base_profile = self._base_profile(search_query)
                     for card in profile_cards[:5]:  # Limit to first 5 results
                         try:
                             # Extract profile data with flexible selectors
-                            name_elem = None
-                            for selector in [".profile-name a", ".name a", "h3 a", "h2 a", "h4 a", "a[href*='profile']"]:
-                                try:
-                                    name_elem = card.find_element(By.CSS_SELECTOR, selector)
-                                    break
-                                except NoSuchElementException:
-                                    continue
+                            name_elem = driver.execute_script(_FIRST_MATCH_JS, card, NAME_LINK_SELECTORS)
                             
                             if not name_elem:
                                 continue
@@ -229,28 +348,23 @@ class ProfileScraper:
                                 'specialties': specialties,
                                 'profile_url': profile_url,
                                 'match_score': match_score,
-                                'status': 'exists_unmanaged',
-                                'npi': search_query.get('npi', ''),
-                                'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
-                                'npi_match': False,
-                                'license_match': False
+                                **base_profile
                             })
                             
                         except Exception as e:
                             print(f"Error parsing profile card: {e}")
                             continue
                     
-                    driver.quit()
                     print(f"✅ Found {len(profiles)} profiles")
                     return profiles
                     
                 except TimeoutException:
                     print("❌ Timeout waiting for Psychology Today results")
-                    driver.quit()
                     return self._handle_timeout(search_query, "Psychology Today")
                 except Exception as e:
                     print(f"❌ Error with Selenium search: {e}")
-                    driver.quit()
+                    # The browser may be unusable after an unexpected error; start a new one next time
+                    self.close()
                     return self._handle_error(search_query, "Psychology Today", str(e))
             
             # Fallback to requests if Selenium fails
@@ -260,6 +374,17 @@ class ProfileScraper:
             print(f"❌ Error searching Psychology Today: {e}")
             return self._handle_error(search_query, "Psychology Today", str(e))
     
+    def search_psychology_today_intelligent_batch(self, search_queries):
+        """
+        Search Psychology Today for several queries one after another in a single
+        browser, returning the results of each query in order. The browser is
+        quit once the batch is done.
+        """
+        try:
+            return [self.search_psychology_today_intelligent(search_query) for search_query in search_queries]
+        finally:
+            self.close()
+    
     def _search_psychology_today_requests(self, search_query):
         """Fallback search using requests library."""
         try:
@@ -291,7 +416,7 @@ class ProfileScraper:
                     'match_score': 0,
                     'status': 'blocked',
                     'npi': search_query.get('npi', ''),
-                    'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
+                    'license': self._first_license(search_query),
                     'npi_match': False,
                     'license_match': False
                 }]
@@ -299,7 +424,7 @@ class ProfileScraper:
                 print(f"❌ Request failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             profiles = []
             
             # Look for profile elements with multiple selectors
@@ -324,14 +449,17 @@ class ProfileScraper:
                     continue
             
             # Also look for any links that might be profiles
-            profile_links = soup.find_all('a', href=lambda x: x and ('profile' in x.lower() or 'therapist' in x.lower() or '/therapists/' in x.lower()))
+            profile_links = soup.find_all('a', href=PROFILE_HREF_RE)
             print(f"🔗 Found {len(profile_links)} potential profile links")
             
-            # Process profile links
+            # Process profile links, skipping any URL already seen
+            seen_urls = set()
+            base_profile = self._base_profile(search_query)
             for link in profile_links[:5]:
                 try:
                     href = link.get('href', '')
-                    if not href or ('profile' not in href.lower() and '/therapists/' not in href.lower()):
+                    href_lower = href.lower()
+                    if not href or ('profile' not in href_lower and '/therapists/' not in href_lower):
                         continue
                     
                     # Skip navigation links
@@ -343,7 +471,7 @@ class ProfileScraper:
                         continue
                     
                     # Skip location pages (e.g., /therapists/fl/casselberry, /therapists/ct/berlin)
-                    if any(loc in href.lower() for loc in ['/fl/', '/ct/', '/ca/', '/ny/', '/tx/', '/ga/', '/nc/', '/sc/', '/al/', '/ms/', '/la/', '/tn/', '/ky/', '/in/', '/oh/', '/mi/', '/wi/', '/mn/', '/ia/', '/mo/', '/ar/', '/ok/', '/ks/', '/ne/', '/nd/', '/sd/', '/mt/', '/wy/', '/co/', '/nm/', '/az/', '/ut/', '/nv/', '/id/', '/wa/', '/or/', '/ak/', '/hi/']):
+                    if STATE_PATH_RE.search(href):
                         continue
                     
                     # Skip if it's the base therapists page
@@ -373,6 +501,8 @@ class ProfileScraper:
                         profile_url = urljoin(base_url, href)
                     else:
                         profile_url = href
+                    if profile_url in seen_urls:
+                        continue
                     
                     # Extract other details from parent elements
                     parent = link.parent
@@ -383,12 +513,12 @@ class ProfileScraper:
                     # Try to find credentials and location in nearby elements
                     if parent:
                         # Look for credentials
-                        cred_elem = parent.find(['div', 'span'], class_=lambda x: x and ('credential' in x.lower() or 'title' in x.lower() or 'degree' in x.lower()))
+                        cred_elem = parent.find(['div', 'span'], class_=CREDENTIALS_CLASS_RE)
                         if cred_elem:
                             credentials = cred_elem.text.strip()
                         
                         # Look for location
-                        loc_elem = parent.find(['div', 'span'], class_=lambda x: x and ('location' in x.lower() or 'address' in x.lower() or 'city' in x.lower()))
+                        loc_elem = parent.find(['div', 'span'], class_=LOCATION_CLASS_RE)
                         if loc_elem:
                             location = loc_elem.text.strip()
                     
@@ -407,12 +537,9 @@ class ProfileScraper:
                         'specialties': specialties,
                         'profile_url': profile_url,
                         'match_score': match_score,
-                        'status': 'exists_unmanaged',
-                        'npi': search_query.get('npi', ''),
-                        'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
-                        'npi_match': False,
-                        'license_match': False
+                        **base_profile
                     })
+                    seen_urls.add(profile_url)
                     
                     print(f"✅ Found profile: {name} - {profile_url}")
                     
@@ -420,21 +547,8 @@ class ProfileScraper:
                     print(f"❌ Error parsing profile link: {e}")
                     continue
             
-            # Deduplicate profiles by URL
-            unique_profiles = []
-            seen_urls = set()
-            
-            for profile in profiles:
-                profile_url = profile.get('profile_url', '')
-                if profile_url and profile_url not in seen_urls:
-                    seen_urls.add(profile_url)
-                    unique_profiles.append(profile)
-                elif not profile_url:
-                    # Keep profiles without URLs (they might be different)
-                    unique_profiles.append(profile)
-            
-            print(f"🎉 Successfully found {len(unique_profiles)} unique profiles using requests!")
-            return unique_profiles
+            print(f"🎉 Successfully found {len(profiles)} unique profiles using requests!")
+            return profiles
             
         except Exception as e:
             print(f"❌ Error with requests search: {e}")
@@ -474,19 +588,20 @@ class ProfileScraper:
                     'match_score': 0,
                     'status': 'blocked',
                     'npi': search_query.get('npi', ''),
-                    'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
+                    'license': self._first_license(search_query),
                     'npi_match': False,
                     'license_match': False
                 }]
             
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             profiles = []
             
             # Look for therapist cards
             therapist_cards = soup.find_all('div', class_='therapist-card')
             
+            base_profile = self._base_profile(search_query)
             for card in therapist_cards[:5]:
                 try:
                     name_elem = card.find('h3', class_='therapist-name')
@@ -527,11 +642,7 @@ class ProfileScraper:
                         'specialties': specialties,
                         'profile_url': profile_url,
                         'match_score': match_score,
-                        'status': 'exists_unmanaged',
-                        'npi': search_query.get('npi', ''),
-                        'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
-                        'npi_match': False,
-                        'license_match': False
+                        **base_profile
                     })
                     
                 except Exception as e:
@@ -567,12 +678,13 @@ class ProfileScraper:
             response = self.session.get(search_url, params=params, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             profiles = []
             
             # Look for therapist cards
             therapist_cards = soup.find_all('div', class_='therapist-card')
             
+            base_profile = self._base_profile(search_query)
             for card in therapist_cards[:5]:
                 try:
                     name_elem = card.find('h3', class_='therapist-name')
@@ -613,11 +725,7 @@ class ProfileScraper:
                         'specialties': specialties,
                         'profile_url': profile_url,
                         'match_score': match_score,
-                        'status': 'exists_unmanaged',
-                        'npi': search_query.get('npi', ''),
-                        'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
-                        'npi_match': False,
-                        'license_match': False
+                        **base_profile
                     })
                     
                 except Exception as e:
@@ -648,15 +756,16 @@ class ProfileScraper:
             response = self.session.get(search_url, params=params, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             profiles = []
             
             # Generic profile extraction
-            profile_cards = soup.find_all(['div', 'article'], class_=re.compile(r'profile|therapist|card'))
+            profile_cards = soup.find_all(['div', 'article'], class_=PROFILE_CARD_CLASS_RE)
             
+            base_profile = self._base_profile(search_query)
             for card in profile_cards[:5]:
                 try:
-                    name_elem = card.find(['h1', 'h2', 'h3', 'h4'], class_=re.compile(r'name|title'))
+                    name_elem = card.find(['h1', 'h2', 'h3', 'h4'], class_=NAME_CLASS_RE)
                     if not name_elem:
                         continue
                         
@@ -678,11 +787,7 @@ class ProfileScraper:
                         'specialties': search_query.get('specialties', []),
                         'profile_url': profile_url,
                         'match_score': match_score,
-                        'status': 'exists_unmanaged',
-                        'npi': search_query.get('npi', ''),
-                        'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
-                        'npi_match': False,
-                        'license_match': False
+                        **base_profile
                     })
                     
                 except Exception as e:
@@ -772,7 +877,7 @@ class ProfileScraper:
             response = self.session.get(profile_url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Extract profile information
             profile_data = {
@@ -789,27 +894,27 @@ class ProfileScraper:
             }
             
             # Extract name
-            name_elem = soup.find(['h1', 'h2'], class_=re.compile(r'name|title'))
+            name_elem = soup.find(['h1', 'h2'], class_=NAME_CLASS_RE)
             if name_elem:
                 profile_data['name'] = name_elem.text.strip()
             
             # Extract credentials
-            credentials_elem = soup.find('div', class_=re.compile(r'credentials|title'))
+            credentials_elem = soup.find('div', class_=PROFILE_CREDENTIALS_CLASS_RE)
             if credentials_elem:
                 profile_data['credentials'] = credentials_elem.text.strip()
             
             # Extract location
-            location_elem = soup.find('div', class_=re.compile(r'location|address'))
+            location_elem = soup.find('div', class_=PROFILE_LOCATION_CLASS_RE)
             if location_elem:
                 profile_data['location'] = location_elem.text.strip()
             
             # Extract specialties
-            specialties_elem = soup.find('div', class_=re.compile(r'specialties|specialties'))
+            specialties_elem = soup.find('div', class_=PROFILE_SPECIALTIES_CLASS_RE)
             if specialties_elem:
                 profile_data['specialties'] = [s.strip() for s in specialties_elem.text.split(',')]
             
             # Extract bio
-            bio_elem = soup.find('div', class_=re.compile(r'bio|description|about'))
+            bio_elem = soup.find('div', class_=PROFILE_BIO_CLASS_RE)
             if bio_elem:
                 profile_data['bio'] = bio_elem.text.strip()
             
@@ -841,6 +946,20 @@ class ProfileScraper:
         
         return comparison
     
+    def _base_profile(self, search_query):
+        """Get the fields shared by every profile found in one search, to spread into each."""
+        return {
+            'status': 'exists_unmanaged',
+            'npi': search_query.get('npi', ''),
+            'license': self._first_license(search_query),
+            'npi_match': False,
+            'license_match': False
+        }
+    
+    def _first_license(self, search_query):
+        """Get the first of the searched therapist's license numbers, or None."""
+        return next(iter((search_query.get('license_numbers') or {}).values()), None)
+    
     def _handle_blocked_search(self, search_query, directory_name):
         """Handle when search is blocked by anti-bot protection."""
         print(f"🚫 Search blocked on {directory_name} - implementing fallback strategy")
@@ -855,7 +974,7 @@ class ProfileScraper:
             'match_score': 0,
             'status': 'blocked',
             'npi': search_query.get('npi', ''),
-            'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
+            'license': self._first_license(search_query),
             'npi_match': False,
             'license_match': False,
             'error_message': f"Search blocked by {directory_name}. Please search manually using: {search_query.get('name', '')} in {search_query.get('location', '')}"
@@ -874,7 +993,7 @@ class ProfileScraper:
             'match_score': 0,
             'status': 'not_found',
             'npi': search_query.get('npi', ''),
-            'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
+            'license': self._first_license(search_query),
             'npi_match': False,
             'license_match': False,
             'error_message': f"No profiles found for {search_query.get('name', '')} on {directory_name}"
@@ -893,7 +1012,7 @@ class ProfileScraper:
             'match_score': 0,
             'status': 'timeout',
             'npi': search_query.get('npi', ''),
-            'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
+            'license': self._first_license(search_query),
             'npi_match': False,
             'license_match': False,
             'error_message': f"Search timed out on {directory_name}. The site may be slow or overloaded."
@@ -912,7 +1031,7 @@ class ProfileScraper:
             'match_score': 0,
             'status': 'error',
             'npi': search_query.get('npi', ''),
-            'license': list(search_query.get('license_numbers', {}).values())[0] if search_query.get('license_numbers') else None,
+            'license': self._first_license(search_query),
             'npi_match': False,
             'license_match': False,
             'error_message': f"Error searching {directory_name}: {error_message}"
@@ -928,7 +1047,7 @@ class ProfileScraper:
                 print(f"❌ Failed to load profile page: {response.status_code}")
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Extract comprehensive profile data
             profile_data = {
@@ -1009,8 +1128,7 @@ class ProfileScraper:
                 if phone_elem:
                     phone_text = phone_elem.get_text(strip=True)
                     # Extract phone number using regex
-                    import re
-                    phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', phone_text)
+                    phone_match = PHONE_RE.search(phone_text)
                     if phone_match:
                         profile_data['phone'] = phone_match.group()
                     break
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+DatabaseManager read-back tests
+"""
+
+import os
+import sqlite3
+import tempfile
+
+from database import DatabaseManager
+
+def test_empty_json_columns_read_back_empty():
+    """Therapists whose JSON columns are NULL or '' read back as empty lists and dicts."""
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "test.db")
+        db = DatabaseManager(db_path)
+        db.add_therapist("Null Columns")
+        db.add_therapist("Empty Columns")
+        
+        # Rows written outside DatabaseManager, as older imports left them
+        conn = sqlite3.connect(db_path)
+        conn.execute('''
+            UPDATE therapists SET specialties = NULL, populations = NULL, therapy_styles = NULL,
+                                  techniques = NULL, interview_responses = NULL
+            WHERE name = 'Null Columns'
+        ''')
+        conn.execute('''
+            UPDATE therapists SET specialties = '', populations = '', therapy_styles = '',
+                                  techniques = '', interview_responses = ''
+            WHERE name = 'Empty Columns'
+        ''')
+        conn.commit()
+        conn.close()
+        
+        therapists = db.get_all_therapists()
+        db.close()
+        
+        assert [therapist['name'] for therapist in therapists] == ["Empty Columns", "Null Columns"]
+        for therapist in therapists:
+            assert therapist['specialties'] == []
+            assert therapist['populations'] == []
+            assert therapist['therapy_styles'] == []
+            assert therapist['techniques'] == []
+            assert therapist['interview_responses'] == {}
+
+if __name__ == "__main__":
+    test_empty_json_columns_read_back_empty()
+    print("✅ DatabaseManager tests passed")
@@ -6,9 +6,11 @@ Runs in your browser - no GUI framework issues!
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
 import sqlite3
 import json
+from concurrent.futures import ThreadPoolExecutor
 from database import DatabaseManager
 from csv_importer import CSVImporter
 import os
+import atexit
 import webbrowser
 from datetime import datetime
 
@@ -18,6 +20,7 @@ app.secret_key = 'directory-manager-secret-key'
 # Initialize database
 db = DatabaseManager()
 csv_importer = CSVImporter(db)
+atexit.register(db.close)
 
 @app.route('/')
 def dashboard():
@@ -788,31 +791,26 @@ def import_google_forms():
         from google_form_importer import GoogleFormImporter
         
         importer = GoogleFormImporter(db)
-        results = {}
+        file_paths = {}
         
         # Check for uploaded files
-        if 'profile_questions' in request.files:
-            file = request.files['profile_questions']
-            if file.filename:
-                file_path = f"temp_{file.filename}"
-                file.save(file_path)
-                results['profile_questions'] = importer.import_profile_questions(file_path)
-                os.remove(file_path)
-        
-        if 'therapist_interview' in request.files:
-            file = request.files['therapist_interview']
-            if file.filename:
-                file_path = f"temp_{file.filename}"
-                file.save(file_path)
-                results['therapist_interview'] = importer.import_therapist_interview(file_path)
-                os.remove(file_path)
-        
-        if 'therapist_info' in request.files:
-            file = request.files['therapist_info']
-            if file.filename:
-                file_path = f"temp_{file.filename}"
-                file.save(file_path)
-                results['therapist_info'] = importer.import_therapist_info(file_path)
+        try:
+            for form in ('profile_questions', 'therapist_interview', 'therapist_info'):
+                if form in request.files:
+                    file = request.files[form]
+                    if file.filename:
+                        file_path = f"temp_{file.filename}"
+                        file.save(file_path)
+                        file_paths[form] = file_path
+            
+            # Import the forms together so each therapist's row is updated once
+            results = importer.import_all(
+                profile_questions_csv=file_paths.get('profile_questions'),
+                therapist_interview_csv=file_paths.get('therapist_interview'),
+                therapist_info_csv=file_paths.get('therapist_info')
+            ) if file_paths else {}
+        finally:
+            for file_path in file_paths.values():
                 os.remove(file_path)
         
         return jsonify({'message': 'Google Form data imported successfully', 'results': results})
@@ -1417,74 +1415,88 @@ def batch_search():
         
         conn.close()
         
-        # Perform batch search
+        def search_directory(therapist, directory_name):
+            """Search one directory for one therapist, as a single batch result."""
+            print(f"  📁 Searching {directory_name} for {therapist['name']}")
+            try:
+                # Get directory info
+                conn = sqlite3.connect(db.db_path)
+                cursor = conn.cursor()
+                cursor.execute('SELECT * FROM directories WHERE name = ?', (directory_name,))
+                directory_row = cursor.fetchone()
+                conn.close()
+                
+                search_results = []
+                if directory_row:
+                    directory = {
+                        'id': directory_row[0],
+                        'name': directory_row[1],
+                        'base_url': directory_row[2],
+                        'login_url': directory_row[3],
+                        'profile_url_template': directory_row[4]
+                    }
+                    
+                    # Search for this therapist on this directory
+                    search_results = perform_intelligent_search(directory, therapist, scrapers[directory_name])
+                
+                # Only ONE result per therapist-directory combination
+                if search_results:
+                    # Take only the first (best) result
+                    result = search_results[0]
+                    return {
+                        'therapist_name': therapist['name'],
+                        'directory_name': directory_name,
+                        'status': result.get('status', 'not_found'),
+                        'profile_url': result.get('profile_url', ''),
+                        'match_score': result.get('match_score', 0),
+                        'npi_match': result.get('npi_match', False),
+                        'license_match': result.get('license_match', False)
+                    }
+                
+                # If no results were returned, add a "not_found" result to show the search was attempted
+                return {
+                    'therapist_name': therapist['name'],
+                    'directory_name': directory_name,
+                    'status': 'not_found',
+                    'profile_url': '',
+                    'match_score': 0,
+                    'npi_match': False,
+                    'license_match': False
+                }
+                
+            except Exception as e:
+                # Add error result
+                print(f"    ❌ Error searching {directory_name} for {therapist['name']}: {str(e)}")
+                return {
+                    'therapist_name': therapist['name'],
+                    'directory_name': directory_name,
+                    'status': 'error',
+                    'profile_url': '',
+                    'match_score': 0,
+                    'error': str(e)
+                }
+        
+        # Perform batch search. Each therapist's directories are different sites, so they
+        # are searched at the same time; each site still gets one request at a time.
+        # Each directory keeps one scraper, whose session reuses its connections to
+        # the site from one therapist to the next.
+        from profile_scraper import ProfileScraper
+        scrapers = {directory_name: ProfileScraper() for directory_name in directories}
         batch_results = []
         print(f"🔍 Starting batch search for {len(therapists)} therapists across {len(directories)} directories")
         
         try:
-            for i, therapist in enumerate(therapists):
-                print(f"👤 Processing therapist {i+1}/{len(therapists)}: {therapist['name']}")
-                for j, directory_name in enumerate(directories):
-                    print(f"  📁 Searching directory {j+1}/{len(directories)}: {directory_name}")
-                    try:
-                        # Get directory info
-                        conn = sqlite3.connect(db.db_path)
-                        cursor = conn.cursor()
-                        cursor.execute('SELECT * FROM directories WHERE name = ?', (directory_name,))
-                        directory_row = cursor.fetchone()
-                        conn.close()
-                        
-                        if directory_row:
-                            directory = {
-                                'id': directory_row[0],
-                                'name': directory_row[1],
-                                'base_url': directory_row[2],
-                                'login_url': directory_row[3],
-                                'profile_url_template': directory_row[4]
-                            }
-                            
-                            # Search for this therapist on this directory
-                            search_results = perform_intelligent_search(directory, therapist)
-                            
-                        # Add to batch results - only ONE result per therapist-directory combination
-                        if search_results:
-                            # Take only the first (best) result
-                            result = search_results[0]
-                            batch_results.append({
-                                'therapist_name': therapist['name'],
-                                'directory_name': directory['name'],
-                                'status': result.get('status', 'not_found'),
-                                'profile_url': result.get('profile_url', ''),
-                                'match_score': result.get('match_score', 0),
-                                'npi_match': result.get('npi_match', False),
-                                'license_match': result.get('license_match', False)
-                            })
-                        else:
-                            # If no results were returned, add a "not_found" result to show the search was attempted
-                            batch_results.append({
-                                'therapist_name': therapist['name'],
-                                'directory_name': directory['name'],
-                                'status': 'not_found',
-                                'profile_url': '',
-                                'match_score': 0,
-                                'npi_match': False,
-                                'license_match': False
-                            })
-                                
-                    except Exception as e:
-                        # Add error result
-                        print(f"    ❌ Error searching {directory_name} for {therapist['name']}: {str(e)}")
-                        batch_results.append({
-                            'therapist_name': therapist['name'],
-                            'directory_name': directory_name,
-                            'status': 'error',
-                            'profile_url': '',
-                            'match_score': 0,
-                            'error': str(e)
-                        })
+            with ThreadPoolExecutor(max_workers=max(len(directories), 1)) as executor:
+                for i, therapist in enumerate(therapists):
+                    print(f"👤 Processing therapist {i+1}/{len(therapists)}: {therapist['name']}")
+                    batch_results.extend(executor.map(search_directory, [therapist] * len(directories), directories))
         except Exception as e:
             print(f"❌ Batch search error: {str(e)}")
             return jsonify({'error': str(e)}), 500
+        finally:
+            # The sessions were kept open for the batch; release their connections now
+            for scraper in scrapers.values():
+                scraper.session.close()
         
         return jsonify({
             'results': batch_results,
@@ -1595,12 +1607,15 @@ def test_directory_scraper(directory_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-def perform_intelligent_search(directory, therapist_info):
-    """Perform intelligent search using NPI, license numbers, and other identifying information."""
+def perform_intelligent_search(directory, therapist_info, scraper=None):
+    """
+    Perform intelligent search using NPI, license numbers, and other identifying information.
+    Pass a scraper to reuse its HTTP connections to the directory across searches.
+    """
     try:
-        from profile_scraper import ProfileScraper
-        
-        scraper = ProfileScraper()
+        if scraper is None:
+            from profile_scraper import ProfileScraper
+            scraper = ProfileScraper()
         
         # Build comprehensive search query
         search_query = {